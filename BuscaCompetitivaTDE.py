@@ -3,8 +3,13 @@
 
 
 import numpy as np
+import math
+import multiprocessing
+import os
 import random
+import struct
 import time
+from concurrent.futures import ProcessPoolExecutor
 
 
 # Verificação de Vitória:
@@ -29,10 +34,172 @@ import time
 
 
 class Board:
-    def __init__(self, size=4):
-        """Inicializa o tabuleiro com o tamanho especificado (4x4 por padrão)."""
+    # Cache das máscaras de vitória (trechos de linhas, colunas e diagonais) por (tamanho, marcas para vencer).
+    _win_lines_cache = {}
+    # Cache das linhas de vitória de cada célula e dos seus pesos por (tamanho, marcas para vencer).
+    _cell_lines_cache = {}
+    # Cache das chaves de Zobrist por tamanho de tabuleiro.
+    _zobrist_cache = {}
+    ZOBRIST_SEED = 20241  # Semente fixa: o mesmo tabuleiro gera o mesmo hash em qualquer execução.
+    # Cache das tabelas de permutação das 8 simetrias por tamanho de tabuleiro.
+    _symmetry_cache = {}
+    SYMMETRIES = 8  # Identidade, 3 rotações e 4 reflexões.
+    ALL_SYMMETRIES = tuple(range(SYMMETRIES))  # Simetrias que preservam o resultado do jogo.
+
+    def __init__(self, size=4, win_length=None):
+        """
+        Inicializa o tabuleiro com o tamanho especificado (4x4 por padrão).
+
+        O estado é guardado como um bitboard: um inteiro por jogador, em que o bit
+        (linha * size + coluna) vale 1 quando a célula pertence ao jogador.
+
+        Parâmetros:
+            size (int): Número de linhas e colunas.
+            win_length (int): Marcas em sequência (na linha, coluna ou diagonal) necessárias para vencer.
+                Por padrão, a linha inteira, como no jogo original.
+        """
+        win_length = size if win_length is None else win_length
+        if not 1 < win_length <= size:
+            raise ValueError(f"O número de marcas para vencer deve estar entre 2 e {size}.")
         self.size = size
-        self.board = np.full((self.size, self.size), '', dtype=str)  # Cria uma matriz vazia de strings para o tabuleiro.
+        self.win_length = win_length
+        self.full_mask = (1 << (size * size)) - 1  # Máscara com todas as células marcadas.
+        self.win_lines = Board.win_lines_for(size, win_length)  # Máscaras pré-calculadas das linhas de vitória.
+        # Linhas de vitória que passam por cada célula e quantas são.
+        self.cell_lines, self.cell_weights = Board.cell_lines_for(size, win_length)
+        center = (size - 1) // 2
+        self.center_bit = 1 << (center * size + center)  # Célula central ((1, 1) no 4x4), com bônus em evaluate.
+        self.win_score = Board.win_score_for(size, win_length)  # Valor de uma vitória na busca.
+        self.masks = {'X': 0, 'O': 0}  # Um bitboard por jogador.
+        # Contadores mantidos a cada jogada para a avaliação incremental e a verificação de vitória: marcas
+        # de cada jogador em cada linha, soma desses contadores, linhas completas de cada jogador e número
+        # total de marcas.
+        self.line_counts = {'X': [0] * len(self.win_lines), 'O': [0] * len(self.win_lines)}
+        self.line_totals = {'X': 0, 'O': 0}
+        self.completed = {'X': 0, 'O': 0}
+        self.marks = 0
+        self.symmetries = Board.symmetries_for(size)  # Permutações e tabelas de consulta das simetrias.
+        self.zobrist = Board.zobrist_keys_for(size)  # Chaves de Zobrist de cada (jogador, célula, simetria).
+        # Hash de Zobrist do tabuleiro visto por cada uma das 8 simetrias, atualizados a cada jogada.
+        self.sym_hashes = (0,) * Board.SYMMETRIES
+
+    @classmethod
+    def win_lines_for(cls, size, win_length=None):
+        """
+        Retorna (e guarda em cache) as máscaras das linhas de vitória do tabuleiro.
+
+        Cada linha de vitória é um trecho de win_length células seguidas de uma linha, coluna ou diagonal
+        (nas duas direções). Com win_length igual ao tamanho, são as linhas, colunas e as duas diagonais.
+        """
+        win_length = size if win_length is None else win_length
+        if (size, win_length) not in cls._win_lines_cache:
+            starts = range(size - win_length + 1)  # Posições iniciais de um trecho ao longo de uma linha.
+
+            def segment(row, col, d_row, d_col):
+                return sum(1 << ((row + step * d_row) * size + col + step * d_col) for step in range(win_length))
+
+            lines = []
+            for i in range(size):
+                lines.extend(segment(i, j, 0, 1) for j in starts)  # Trechos da linha i.
+                lines.extend(segment(j, i, 1, 0) for j in starts)  # Trechos da coluna i.
+            lines.extend(segment(i, j, 1, 1) for i in starts for j in starts)  # Diagonais principais.
+            lines.extend(segment(i, size - 1 - j, 1, -1) for i in starts for j in starts)  # Diagonais secundárias.
+            cls._win_lines_cache[size, win_length] = tuple(lines)
+        return cls._win_lines_cache[size, win_length]
+
+    @classmethod
+    def cell_lines_for(cls, size, win_length=None):
+        """Retorna (e guarda em cache) os índices das linhas de vitória que passam por cada célula e quantas são."""
+        win_length = size if win_length is None else win_length
+        if (size, win_length) not in cls._cell_lines_cache:
+            lines = cls.win_lines_for(size, win_length)
+            cell_lines = tuple(tuple(number for number, line in enumerate(lines) if line >> index & 1)
+                               for index in range(size * size))
+            cls._cell_lines_cache[size, win_length] = cell_lines, tuple(len(numbers) for numbers in cell_lines)
+        return cls._cell_lines_cache[size, win_length]
+
+    @classmethod
+    def win_score_for(cls, size, win_length=None):
+        """
+        Retorna o valor de uma vitória para a busca.
+
+        No jogo original (4x4, a linha inteira para vencer) a vitória vale 10. Nos demais tabuleiros, as
+        células participam de mais linhas e a heurística cresce com o tamanho, então a vitória passa a
+        valer mais que qualquer avaliação possível (todas as linhas, todas as células vazias e o centro).
+        """
+        win_length = size if win_length is None else win_length
+        if size == win_length == 4:
+            return 10
+        return sum(cls.cell_lines_for(size, win_length)[1]) + size * size + 5 + 1
+
+    @classmethod
+    def symmetries_for(cls, size):
+        """
+        Retorna (e guarda em cache) as tabelas das 8 simetrias do tabuleiro.
+
+        Retorna:
+            dict: 'perm' (célula -> célula transformada, por simetria), 'inverse' (a permutação inversa),
+            'chunks' (tabelas de 256 entradas que transformam uma máscara de 8 em 8 bits) e 'heuristic'
+            (as simetrias que mantêm a célula central de evaluate no lugar e, portanto, o seu valor).
+        """
+        if size not in cls._symmetry_cache:
+            last = size - 1
+            transforms = (
+                lambda r, c: (r, c),                # Identidade.
+                lambda r, c: (c, last - r),         # Rotação de 90 graus.
+                lambda r, c: (last - r, last - c),  # Rotação de 180 graus.
+                lambda r, c: (last - c, r),         # Rotação de 270 graus.
+                lambda r, c: (r, last - c),         # Reflexão horizontal.
+                lambda r, c: (last - r, c),         # Reflexão vertical.
+                lambda r, c: (c, r),                # Reflexão na diagonal principal.
+                lambda r, c: (last - c, last - r),  # Reflexão na diagonal secundária.
+            )
+            cells = size * size
+            perm = tuple(tuple(row * size + col for row, col in (t(*divmod(index, size)) for index in range(cells)))
+                         for t in transforms)
+            inverse = tuple(tuple(p.index(index) for index in range(cells)) for p in perm)
+            chunks = tuple(
+                tuple((shift, tuple(sum(1 << p[shift + bit] for bit in range(8) if byte >> bit & 1
+                                        and shift + bit < cells) for byte in range(256)))
+                      for shift in range(0, cells, 8))
+                for p in perm
+            )
+            center = (size - 1) // 2 * (size + 1)  # Célula central, que recebe o bônus de centro em evaluate.
+            heuristic = tuple(t for t, p in enumerate(perm) if p[center] == center)
+            cls._symmetry_cache[size] = {'perm': perm, 'inverse': inverse, 'chunks': chunks, 'heuristic': heuristic}
+        return cls._symmetry_cache[size]
+
+    @classmethod
+    def zobrist_keys_for(cls, size):
+        """
+        Retorna (e guarda em cache) as chaves de Zobrist do tabuleiro.
+
+        Cada par (jogador, célula) tem uma chave aleatória de 64 bits; a entrada da célula guarda as chaves
+        das células para onde ela vai em cada simetria, para que os 8 hashes sejam atualizados juntos.
+        """
+        if size not in cls._zobrist_cache:
+            rng = random.Random(cls.ZOBRIST_SEED + size)
+            perm = cls.symmetries_for(size)['perm']
+            keys = {}
+            for player in ('X', 'O'):
+                base = [rng.getrandbits(64) for _ in range(size * size)]
+                keys[player] = tuple(tuple(base[p[index]] for p in perm) for index in range(size * size))
+            cls._zobrist_cache[size] = keys
+        return cls._zobrist_cache[size]
+
+    @property
+    def hash(self):
+        """Hash de Zobrist do tabuleiro na orientação real."""
+        return self.sym_hashes[0]
+
+    @property
+    def board(self):
+        """Retorna o tabuleiro como uma matriz de strings ('', 'X' ou 'O'), usada para exibição."""
+        grid = np.full((self.size, self.size), '', dtype=str)
+        for i in range(self.size):
+            for j in range(self.size):
+                grid[i, j] = self.get(i, j)
+        return grid
 
     def display(self):
         """Exibe o tabuleiro como uma matriz."""
@@ -40,85 +207,1191 @@ class Board:
 
     def reset(self):
         """Reinicia o tabuleiro."""
-        self.board = np.full((self.size, self.size), '', dtype=str)  # Redefine o tabuleiro para seu estado vazio.
+        self.masks = {'X': 0, 'O': 0}  # Redefine o tabuleiro para seu estado vazio.
+        self.sym_hashes = (0,) * Board.SYMMETRIES
+        self.line_counts = {'X': [0] * len(self.win_lines), 'O': [0] * len(self.win_lines)}
+        self.line_totals = {'X': 0, 'O': 0}
+        self.completed = {'X': 0, 'O': 0}
+        self.marks = 0
+
+    @classmethod
+    def from_masks(cls, size, x_mask, o_mask, win_length=None):
+        """Cria um tabuleiro a partir dos bitboards de 'X' e 'O'."""
+        board = cls(size, win_length)
+        for index in range(size * size):
+            if x_mask >> index & 1:
+                board.make_move(*divmod(index, size), 'X')
+            elif o_mask >> index & 1:
+                board.make_move(*divmod(index, size), 'O')
+        return board
+
+    def copy(self):
+        """Retorna uma cópia independente do tabuleiro."""
+        clone = Board(self.size, self.win_length)
+        clone.masks = dict(self.masks)
+        clone.sym_hashes = self.sym_hashes
+        clone.line_counts = {player: list(counts) for player, counts in self.line_counts.items()}
+        clone.line_totals = dict(self.line_totals)
+        clone.completed = dict(self.completed)
+        clone.marks = self.marks
+        return clone
+
+    def get(self, row, col):
+        """Retorna o símbolo da célula especificada ('' se estiver vazia)."""
+        bit = 1 << (row * self.size + col)
+        if self.masks['X'] & bit:
+            return 'X'
+        if self.masks['O'] & bit:
+            return 'O'
+        return ''
+
+    def empty_cells(self):
+        """Retorna as células vazias em ordem de linha, como tuplas (linha, coluna)."""
+        occupied = self.masks['X'] | self.masks['O']
+        return [divmod(index, self.size) for index in range(self.size * self.size) if not occupied >> index & 1]
 
     def is_full(self):
         """Verifica se o tabuleiro está cheio."""
-        return '' not in self.board  # Retorna True se não houver células vazias no tabuleiro.
+        return (self.masks['X'] | self.masks['O']) == self.full_mask  # True se todas as células estiverem marcadas.
 
     def make_move(self, row, col, player):
         """Marca o tabuleiro na posição especificada com o símbolo do jogador."""
-        if self.board[row, col] == '':  # Verifica se a célula está vazia.
-            self.board[row, col] = player  # Preenche a célula com o símbolo do jogador.
-            return True  # Movimento bem-sucedido.
-        return False  # Movimento inválido, célula já ocupada.
+        index = row * self.size + col
+        bit = 1 << index
+        if (self.masks['X'] | self.masks['O']) & bit:  # Verifica se a célula está ocupada.
+            return False  # Movimento inválido, célula já ocupada.
+        self.masks[player] |= bit  # Preenche a célula com o símbolo do jogador.
+        # Atualiza incrementalmente os hashes de todas as simetrias.
+        self.sym_hashes = tuple(map(int.__xor__, self.sym_hashes, self.zobrist[player][index]))
+        # Atualiza os contadores das linhas que passam pela célula (as únicas que a jogada pode completar).
+        counts = self.line_counts[player]
+        win_length = self.win_length
+        for line in self.cell_lines[index]:
+            counts[line] += 1
+            if counts[line] == win_length:
+                self.completed[player] += 1
+        self.line_totals[player] += self.cell_weights[index]
+        self.marks += 1
+        return True  # Movimento bem-sucedido.
+
+    def undo_move(self, row, col):
+        """Desfaz a jogada na posição especificada, deixando a célula vazia."""
+        index = row * self.size + col
+        bit = 1 << index
+        for player in ('X', 'O'):
+            if self.masks[player] & bit:
+                self.masks[player] &= ~bit
+                self.sym_hashes = tuple(map(int.__xor__, self.sym_hashes, self.zobrist[player][index]))
+                counts = self.line_counts[player]
+                for line in self.cell_lines[index]:
+                    if counts[line] == self.win_length:
+                        self.completed[player] -= 1
+                    counts[line] -= 1
+                self.line_totals[player] -= self.cell_weights[index]
+                self.marks -= 1
+
+    def transform_mask(self, mask, transform):
+        """Aplica uma das 8 simetrias a uma máscara de células, consultando as tabelas pré-calculadas."""
+        result = 0
+        for shift, table in self.symmetries['chunks'][transform]:
+            result |= table[mask >> shift & 0xFF]
+        return result
+
+    def canonical_key(self, symmetries=None):
+        """
+        Retorna a chave canônica da posição e a simetria que leva o tabuleiro até ela.
 
-    def check_victory(self, player):
-        """Verifica se o jogador especificado venceu."""
-        # Verifica se o jogador venceu em qualquer linha ou coluna.
-        for i in range(self.size):
-            if all(self.board[i, j] == player for j in range(self.size)) or \
-               all(self.board[j, i] == player for j in range(self.size)):
-                return True
+        Posições simétricas têm o mesmo conjunto de hashes, então o menor deles identifica a classe
+        inteira; a simetria escolhida é a que produz esse menor hash.
 
-        # Verifica se o jogador venceu em qualquer uma das diagonais.
-        if all(self.board[i, i] == player for i in range(self.size)) or \
-           all(self.board[i, self.size - 1 - i] == player for i in range(self.size)):
-            return True
+        Parâmetros:
+            symmetries (tuple): Simetrias consideradas. Por padrão, apenas as que preservam o valor de
+                evaluate (o bônus da célula central não é simétrico por rotação em tabuleiros pares);
+                Board.ALL_SYMMETRIES serve para valores exatos do jogo, que não dependem da heurística.
+        """
+        if symmetries is None:
+            symmetries = self.symmetries['heuristic']
+        key, transform = min((self.sym_hashes[t], t) for t in symmetries)
+        return key, transform
+
+    def canonical(self, symmetries=None):
+        """Retorna as máscaras ('X', 'O') da forma canônica da posição e a simetria usada."""
+        transform = self.canonical_key(symmetries)[1]
+        return (self.transform_mask(self.masks['X'], transform),
+                self.transform_mask(self.masks['O'], transform), transform)
+
+    def to_canonical_move(self, index, transform):
+        """Converte o índice de uma célula real para a orientação canônica."""
+        return self.symmetries['perm'][transform][index]
+
+    def from_canonical_move(self, index, transform):
+        """Converte o índice de uma célula na orientação canônica de volta para o tabuleiro real."""
+        return self.symmetries['inverse'][transform][index]
+
+    def unique_moves(self, symmetries=None):
+        """
+        Retorna as células vazias, mantendo apenas uma de cada grupo de jogadas simétricas.
 
-        return False  # Retorna False se não houver vitória.
+        Duas jogadas são equivalentes quando alguma simetria que preserva a posição atual leva uma à outra;
+        de cada grupo fica a primeira célula em ordem de linha, que já está em coordenadas reais. As
+        simetrias consideradas seguem a mesma regra de canonical_key.
+        """
+        if symmetries is None:
+            symmetries = self.symmetries['heuristic']
+        x, o = self.masks['X'], self.masks['O']
+        stabilizer = [self.symmetries['perm'][t] for t in symmetries
+                      if self.transform_mask(x, t) == x and self.transform_mask(o, t) == o]
+        return [(i, j) for i, j in self.empty_cells()
+                if min(p[i * self.size + j] for p in stabilizer) == i * self.size + j]
+
+    def winning_cells(self, player):
+        """Retorna a máscara das células vazias que dariam a vitória imediata ao jogador."""
+        mine = self.line_counts[player]
+        theirs = self.line_counts['O' if player == 'X' else 'X']
+        cells = 0
+        for number, line in enumerate(self.win_lines):
+            if mine[number] == self.win_length - 1 and not theirs[number]:
+                cells |= line & ~self.masks[player]  # A única célula vazia da linha.
+        return cells
+
+    def check_victory(self, player):
+        """
+        Verifica se o jogador especificado venceu.
+
+        make_move e undo_move atualizam apenas as linhas que passam pela célula jogada e contam as que
+        ficam completas, então a verificação é O(1).
+        """
+        return self.completed[player] > 0  # Alguma linha de vitória está toda marcada pelo jogador.
 
     def evaluate(self, player):
         """
         Avalia o tabuleiro e retorna um valor heurístico para o jogador especificado.
         O valor é calculado com base nas marcas do jogador e do oponente nas linhas, colunas e diagonais.
+        Os contadores de linhas são mantidos por make_move e undo_move, então o cálculo é O(1).
         """
         opponent = 'O' if player == 'X' else 'X'  # Define o símbolo do oponente
-        score = 0  # Inicializa o placar.
 
-        # Avaliação das linhas e colunas
-        for i in range(self.size):
-            # Conta o número de marcações do jogador e do oponente em cada linha.
-            row_count = np.sum(self.board[i] == player)
-            opponent_row_count = np.sum(self.board[i] == opponent)
-            score += row_count  # +1 para cada marcação do jogador.
-            score -= opponent_row_count  # -1 para cada marcação do oponente.
-
-            # Conta o número de marcações do jogador e do oponente em cada coluna.
-            col_count = np.sum(self.board[:, i] == player)
-            opponent_col_count = np.sum(self.board[:, i] == opponent)
-            score += col_count  # +1 para cada marcação do jogador.
-            score -= opponent_col_count  # -1 para cada marcação do oponente.
-
-        # Avaliação das diagonais
-        # Conta o número de marcações do jogador e do oponente na diagonal principal.
-        main_diag_count = np.sum(self.board[i, i] == player for i in range(self.size))
-        opponent_main_diag_count = np.sum(self.board[i, i] == opponent for i in range(self.size))
-        score += main_diag_count  # +1 para cada marcação do jogador na diagonal principal.
-        score -= opponent_main_diag_count  # -1 para cada marcação do oponente na diagonal principal.
-
-        # Conta o número de marcações do jogador e do oponente na diagonal secundária.
-        anti_diag_count = np.sum(self.board[i, self.size - 1 - i] == player for i in range(self.size))
-        opponent_anti_diag_count = np.sum(self.board[i, self.size - 1 - i] == opponent for i in range(self.size))
-        score += anti_diag_count  # +1 para cada marcação do jogador na diagonal secundária.
-        score -= opponent_anti_diag_count  # -1 para cada marcação do oponente na diagonal secundária.
-
-        # Contar o número de células vazias no tabuleiro.
-        empty_cells = np.sum(self.board == '')
-        score += empty_cells  # +1 para cada célula vazia.
+        # +1 para cada marcação do jogador e -1 para cada marcação do oponente em cada linha de vitória
+        # (linhas, colunas e diagonais inteiras no jogo original; trechos de win_length células nos
+        # demais, então o peso de cada célula cresce com o tabuleiro).
+        score = self.line_totals[player] - self.line_totals[opponent]
+
+        # +1 para cada célula vazia.
+        score += self.size * self.size - self.marks
 
         # Avaliação da célula central.
-        if self.board[1, 1] == player:
+        if self.masks[player] & self.center_bit:
             score += 5  # Bônus se o jogador marcar a célula central.
-        elif self.board[1, 1] == opponent:
+        elif self.masks[opponent] & self.center_bit:
             score -= 5  # Penalidade se o oponente marcar a célula central.
 
         return score  # Retorna o valor heurístico final.
 
+    @classmethod
+    def evaluate_batch(cls, boards, player, win_length=None):
+        """
+        Avalia um lote de tabuleiros de uma só vez, com a mesma heurística de evaluate().
+
+        Parâmetros:
+            boards (np.ndarray): Matriz (n, size, size) com '', 'X' e 'O' (como a propriedade board) ou
+                com 1 (X), -1 (O) e 0 (vazia).
+            player (str): Jogador para o qual os tabuleiros são avaliados.
+            win_length (int): Marcas em sequência para vencer (por padrão, o tamanho do tabuleiro).
+
+        Retorna:
+            np.ndarray: Os n valores heurísticos.
+        """
+        opponent = 'O' if player == 'X' else 'X'
+        boards = np.asarray(boards)
+        size = boards.shape[-1]
+        cells = boards.reshape(len(boards), size * size)
+        if cells.dtype.kind in 'US':
+            mine, theirs = cells == player, cells == opponent
+        else:
+            sign = 1 if player == 'X' else -1
+            mine, theirs = cells == sign, cells == -sign
+        diff = mine.astype(np.int64) - theirs  # +1 para o jogador, -1 para o oponente, 0 se vazia.
+        weights = np.array(cls.cell_lines_for(size, win_length)[1], dtype=np.int64)
+        score = diff @ weights  # Marcas em cada linha de vitória.
+        score += size * size - mine.sum(axis=1) - theirs.sum(axis=1)  # Células vazias.
+        score += 5 * diff[:, (size - 1) // 2 * (size + 1)]  # Célula central.
+        return score
+
+
+# Tabela de Transposição:
+# 
+# Ordens de jogada diferentes levam frequentemente à mesma posição (por exemplo, X em (1, 1) e depois em (2, 2),
+# ou o contrário). A tabela de transposição guarda o resultado de cada posição já buscada, indexado pelo hash de
+# Zobrist do tabuleiro, para que a busca não precise repetir o trabalho.
+# 
+# Cada entrada guarda a profundidade buscada, o valor, o tipo de limite (exato, inferior ou superior, já que a
+# poda Alpha-Beta nem sempre calcula o valor exato) e a melhor jogada encontrada.
+# 
+# A tabela tem tamanho fixo: cada hash ocupa uma posição (hash % max_entries). Quando duas posições disputam a
+# mesma posição da tabela, vence a entrada mais profunda, a não ser que a antiga seja de uma busca anterior.
+# 
+# Com a simetria ativa, a chave é o hash canônico (o menor dos hashes das rotações e reflexões que preservam a
+# avaliação), de modo que posições simétricas compartilham a mesma entrada; a melhor jogada é guardada na
+# orientação canônica.
 
 # In[3]:
 
 
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2  # Tipos de limite guardados na tabela de transposição.
+
+
+class TranspositionTable:
+    def __init__(self, max_entries=1 << 20):
+        """
+        Inicializa a tabela de transposição.
+
+        Parâmetros:
+            max_entries (int): Número máximo de entradas mantidas na tabela.
+        """
+        self.max_entries = max_entries
+        self.entries = {}  # Posição na tabela -> (hash, profundidade, valor, limite, melhor jogada, geração).
+        self.generation = 0  # Identifica a busca atual, usado na política de substituição.
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Zera os contadores de acertos, faltas, colisões e gravações."""
+        self.hits = 0  # Posição encontrada na tabela.
+        self.misses = 0  # Posição da tabela vazia.
+        self.collisions = 0  # Posição da tabela ocupada por outro hash.
+        self.stores = 0  # Entradas gravadas.
+
+    def clear(self):
+        """Remove todas as entradas da tabela."""
+        self.entries.clear()
+        self.generation = 0
+
+    def new_search(self):
+        """Marca o início de uma nova busca: entradas antigas passam a ter prioridade menor."""
+        self.generation += 1
+        self.reset_stats()
+
+    def peek(self, key):
+        """Retorna a entrada do hash especificado sem alterar os contadores (None se não estiver na tabela)."""
+        entry = self.entries.get(key % self.max_entries)
+        return entry if entry is not None and entry[0] == key else None
+
+    def probe(self, key):
+        """Retorna a entrada do hash especificado, ou None se ela não estiver na tabela."""
+        entry = self.entries.get(key % self.max_entries)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry[0] != key:
+            self.collisions += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def store(self, key, depth, value, flag, best_move):
+        """Grava o resultado de uma busca, respeitando a política de substituição por profundidade."""
+        slot = key % self.max_entries
+        entry = self.entries.get(slot)
+        # Substitui se a posição estiver vazia, for o mesmo hash, vier de uma busca anterior ou for mais rasa.
+        if entry is None or entry[0] == key or entry[5] != self.generation or depth >= entry[1]:
+            self.entries[slot] = (key, depth, value, flag, best_move, self.generation)
+            self.stores += 1
+
+    def summary(self):
+        """Retorna um resumo dos contadores da tabela."""
+        probes = self.hits + self.misses + self.collisions
+        hit_rate = 100 * self.hits / probes if probes else 0.0
+        return (f"Tabela de transposição: {self.hits} acertos, {self.misses} faltas, "
+                f"{self.collisions} colisões ({hit_rate:.1f}% de acertos, {len(self.entries)} entradas)")
+
+
+# Ordenação de Jogadas:
+# 
+# A poda Alpha-Beta corta mais ramos quando as melhores jogadas são examinadas primeiro. A ordem usada em cada nó é:
+# 
+# 1. A melhor jogada guardada na tabela de transposição (ou da variação principal da iteração anterior).
+# 
+# 2. Jogadas que vencem imediatamente e, em seguida, as que bloqueiam uma vitória imediata do oponente.
+# 
+# 3. Jogadas "killer": as que causaram poda em outro nó da mesma profundidade do jogo.
+# 
+# 4. Heurística de histórico: jogadas que já causaram poda recebem pontos (profundidade ao quadrado).
+# 
+# 5. Ordem estática: células que participam de mais linhas de vitória (diagonais e cantos) vêm antes.
+
+# In[4]:
+
+
+class MoveOrdering:
+    HINT = 1 << 60  # Prioridade da melhor jogada conhecida.
+    WIN = 1 << 59  # Prioridade de uma vitória imediata.
+    BLOCK = 1 << 58  # Prioridade do bloqueio de uma vitória do oponente.
+    KILLER = 1 << 56  # Prioridade das jogadas killer (a primeira recebe o dobro).
+    KILLER_SLOTS = 2  # Jogadas killer guardadas por profundidade.
+
+    def __init__(self):
+        """Inicializa as tabelas de jogadas killer e de histórico."""
+        self.killers = {}  # Número de marcas no tabuleiro -> jogadas killer mais recentes.
+        self.history = {'X': {}, 'O': {}}  # Jogador -> célula -> pontuação de histórico.
+
+    def clear(self):
+        """Descarta as jogadas killer e o histórico."""
+        self.killers.clear()
+        self.history = {'X': {}, 'O': {}}
+
+    def order(self, board, player, moves, hint=None):
+        """
+        Ordena as jogadas do jogador, da mais para a menos promissora.
+
+        Parâmetros:
+            board (Board): Tabuleiro da posição atual.
+            player (str): Jogador que vai jogar.
+            moves (list): Jogadas candidatas, como tuplas (linha, coluna).
+            hint (int): Índice da melhor jogada conhecida da posição (opcional).
+
+        Retorna:
+            list: As jogadas ordenadas; empates mantêm a ordem original.
+        """
+        wins = board.winning_cells(player)
+        blocks = board.winning_cells('O' if player == 'X' else 'X')
+        ply = (board.masks['X'] | board.masks['O']).bit_count()
+        killers = self.killers.get(ply, ())
+        history = self.history[player]
+        weights = board.cell_weights
+
+        def score(move):
+            index = move[0] * board.size + move[1]
+            value = history.get(index, 0) * 64 + weights[index]
+            if index == hint:
+                value += self.HINT
+            if wins >> index & 1:
+                value += self.WIN
+            elif blocks >> index & 1:
+                value += self.BLOCK
+            if index in killers:
+                value += self.KILLER * (self.KILLER_SLOTS - killers.index(index))
+            return value
+
+        return sorted(moves, key=score, reverse=True)
+
+    def record_cutoff(self, board, player, move, depth):
+        """Registra uma jogada que causou poda como killer da profundidade atual e no histórico."""
+        index = move[0] * board.size + move[1]
+        ply = (board.masks['X'] | board.masks['O']).bit_count()
+        killers = self.killers.setdefault(ply, [])
+        if index in killers:
+            killers.remove(index)
+        killers.insert(0, index)
+        del killers[self.KILLER_SLOTS:]
+        history = self.history[player]
+        history[index] = history.get(index, 0) + depth * depth
+
+
+# Busca de Ameaças:
+# 
+# Antes da busca completa, uma busca tática examina apenas jogadas forçantes, usando os contadores de marcas de cada linha de vitória (mantidos por make_move e undo_move):
+# 
+# 1. Vitória imediata: uma linha com todas as marcas do jogador menos uma e nenhuma do oponente.
+# 
+# 2. Bloqueio obrigatório: se o oponente tem uma vitória imediata, a única jogada que não perde é bloqueá-la; se ele tem duas ou mais, a posição está perdida.
+# 
+# 3. Ameaças: jogadas que deixam uma linha a uma marca de ser completada (com duas dessas linhas, é uma ameaça dupla). O oponente é obrigado a bloquear, e a busca continua só pelas jogadas forçantes, até o limite de jogadas.
+# 
+# Quando a busca prova uma vitória ou uma derrota, a jogada é feita sem a busca completa. Dentro da árvore, os passos 1 e 2 (que não exigem busca) encerram os nós decididos e reduzem os nós com bloqueio obrigatório a uma jogada, desde que a profundidade restante alcance o resultado.
+
+# In[5]:
+
+
+class ThreatSearch:
+    WIN = 1  # O jogador da vez vence à força.
+    LOSS = -1  # O jogador da vez perde à força.
+
+    def __init__(self, max_plies=7):
+        """
+        Inicializa a busca de ameaças.
+
+        Parâmetros:
+            max_plies (int): Número máximo de jogadas (dos dois jogadores) de uma sequência forçada.
+        """
+        self.max_plies = max_plies
+        self.nodes = 0  # Nós visitados na última busca.
+
+    def immediate(self, board, player, plies):
+        """
+        Verificação estática de uma posição, sem busca.
+
+        Parâmetros:
+            board (Board): Posição atual.
+            player (str): Jogador da vez.
+            plies (int): Jogadas disponíveis; com menos de 2, os bloqueios não são examinados.
+
+        Retorna:
+            tuple: (resultado, índice da jogada). O resultado é WIN (vitória imediata), LOSS (o oponente tem
+            duas vitórias imediatas) ou None; a jogada é a vitória, o bloqueio obrigatório ou None.
+        """
+        wins = board.winning_cells(player)
+        if wins:
+            return self.WIN, (wins & -wins).bit_length() - 1
+        blocks = board.winning_cells('O' if player == 'X' else 'X') if plies >= 2 else 0
+        if not blocks:
+            return None, None
+        return (self.LOSS if blocks & (blocks - 1) else None), (blocks & -blocks).bit_length() - 1
+
+    def threat_moves(self, board, player):
+        """
+        Retorna os índices das células que deixam alguma linha a uma marca de ser completada pelo jogador.
+
+        As células que criam mais ameaças (ameaças duplas) vêm primeiro.
+        """
+        mine = board.line_counts[player]
+        theirs = board.line_counts['O' if player == 'X' else 'X']
+        free = board.full_mask & ~(board.masks['X'] | board.masks['O'])
+        threats = {}
+        for number, line in enumerate(board.win_lines):
+            if mine[number] == board.win_length - 2 and not theirs[number]:
+                cells = line & free
+                while cells:
+                    bit = cells & -cells
+                    cells ^= bit
+                    index = bit.bit_length() - 1
+                    threats[index] = threats.get(index, 0) + 1
+        return sorted(threats, key=lambda index: (-threats[index], index))
+
+    def solve(self, board, player, max_plies=None):
+        """
+        Procura uma vitória ou uma derrota forçada do jogador da vez.
+
+        Parâmetros:
+            board (Board): Posição atual (restaurada ao final).
+            player (str): Jogador da vez.
+            max_plies (int): Limite de jogadas da sequência (padrão: o da busca).
+
+        Retorna:
+            tuple: (resultado, sequência). O resultado é WIN, LOSS ou None (nada provado); a sequência traz as
+            jogadas (linha, coluna) da prova, a partir da jogada do jogador. Sem prova, a sequência tem só o
+            bloqueio obrigatório, se houver, ou é vazia.
+        """
+        self.nodes = 0
+        result, line = self.prove(board, player, self.max_plies if max_plies is None else max_plies)
+        return result, [divmod(index, board.size) for index in line]
+
+    def prove(self, board, player, plies):
+        """Busca recursiva de solve, com as jogadas como índices de células."""
+        self.nodes += 1
+        if plies < 1:
+            return None, []
+        result, forced = self.immediate(board, player, plies)
+        if result == self.WIN:
+            return result, [forced]
+        opponent = 'O' if player == 'X' else 'X'
+        if result == self.LOSS:
+            # Qualquer bloqueio deixa outra vitória do oponente.
+            blocks = board.winning_cells(opponent) & ~(1 << forced)
+            return result, [forced, (blocks & -blocks).bit_length() - 1]
+        if forced is not None:
+            board.make_move(*divmod(forced, board.size), player)
+            result, line = self.prove(board, opponent, plies - 1)
+            board.undo_move(*divmod(forced, board.size))
+            return (-result if result is not None else None), [forced] + (line if result is not None else [])
+        if plies < 3:
+            return None, []
+        for index in self.threat_moves(board, player):
+            board.make_move(*divmod(index, board.size), player)
+            result, line = self.prove(board, opponent, plies - 1)  # O oponente é obrigado a bloquear.
+            board.undo_move(*divmod(index, board.size))
+            if result == self.LOSS:
+                return self.WIN, [index] + line
+        return None, []
+
+
+# Busca em Árvore de Monte Carlo (MCTS):
+# 
+# Em vez de examinar todas as jogadas até uma profundidade fixa, a MCTS repete quatro passos até o fim do orçamento (tempo ou número de simulações):
+# 
+# 1. Seleção: desce pela árvore escolhendo em cada nó o filho com maior UCT, taxa de vitórias + c * sqrt(ln N / n), que equilibra jogadas boas e jogadas pouco exploradas.
+# 
+# 2. Expansão: ao chegar a uma folha já visitada, cria de uma vez os filhos de todas as jogadas possíveis.
+# 
+# 3. Simulação: joga um lote de partidas aleatórias a partir da folha, todas ao mesmo tempo com NumPy: cada partida é uma permutação aleatória das células vazias, e o vencedor é quem completa primeiro uma linha de vitória.
+# 
+# 4. Retropropagação: soma as vitórias (empate vale meio ponto) e as visitas em todos os nós do caminho.
+# 
+# A árvore fica em vetores NumPy (pai, jogada, primeiro filho, número de filhos, visitas e pontos), com os filhos de cada nó em posições consecutivas. A jogada escolhida é a do filho mais visitado da raiz. Opcionalmente, a subárvore da posição seguinte é aproveitada na próxima jogada.
+
+# In[6]:
+
+
+class MonteCarloTree:
+    INITIAL_CAPACITY = 1 << 12  # Nós alocados na criação; a capacidade dobra quando acaba.
+    EXPLORATION = 1.4  # Constante c do UCT (aproximadamente raiz de 2).
+    NONTERMINAL, WIN, DRAW = 0, 1, 2  # Estado de um nó para quem fez a jogada que leva a ele.
+
+    # Cache das células de cada linha de vitória, como matriz (linhas, win_length), por variante do tabuleiro.
+    _line_cells_cache = {}
+
+    def __init__(self, batch_size=64, seed=None):
+        """
+        Inicializa a árvore vazia.
+
+        Parâmetros:
+            batch_size (int): Partidas aleatórias simuladas juntas a cada folha.
+            seed (int): Semente do gerador das simulações.
+        """
+        self.batch_size = batch_size
+        self.rng = np.random.default_rng(seed)
+        self.clear()
+
+    def clear(self):
+        """Descarta a árvore."""
+        capacity = self.INITIAL_CAPACITY
+        self.count = 0  # Nós em uso; a raiz é sempre o nó 0.
+        self.parent = np.full(capacity, -1, dtype=np.int32)
+        self.move = np.full(capacity, -1, dtype=np.int16)  # Célula jogada para chegar ao nó.
+        self.first_child = np.full(capacity, -1, dtype=np.int32)
+        self.child_count = np.zeros(capacity, dtype=np.int16)
+        self.terminal = np.zeros(capacity, dtype=np.int8)
+        self.visits = np.zeros(capacity, dtype=np.float64)
+        self.score = np.zeros(capacity, dtype=np.float64)  # Pontos de quem fez a jogada que leva ao nó.
+        self.root_masks = None  # Bitboards ('X', 'O') da posição da raiz.
+        self.root_player = None  # Jogador da vez na raiz.
+        self.playouts = 0  # Partidas simuladas na última busca.
+        self.max_depth = 0  # Maior profundidade alcançada pela seleção na última busca.
+
+    @classmethod
+    def line_cells_for(cls, board):
+        """Retorna (e guarda em cache) a matriz com os índices das células de cada linha de vitória."""
+        key = (board.size, board.win_length)
+        if key not in cls._line_cells_cache:
+            cells = board.size * board.size
+            cls._line_cells_cache[key] = np.array(
+                [[index for index in range(cells) if line >> index & 1] for line in board.win_lines], dtype=np.intp)
+        return cls._line_cells_cache[key]
+
+    def allocate(self, count):
+        """Reserva count nós consecutivos, aumentando os vetores se necessário, e retorna o primeiro."""
+        needed = self.count + count
+        capacity = len(self.parent)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            extra = capacity - len(self.parent)
+            self.parent = np.concatenate([self.parent, np.full(extra, -1, dtype=np.int32)])
+            self.move = np.concatenate([self.move, np.full(extra, -1, dtype=np.int16)])
+            self.first_child = np.concatenate([self.first_child, np.full(extra, -1, dtype=np.int32)])
+            self.child_count = np.concatenate([self.child_count, np.zeros(extra, dtype=np.int16)])
+            self.terminal = np.concatenate([self.terminal, np.zeros(extra, dtype=np.int8)])
+            self.visits = np.concatenate([self.visits, np.zeros(extra)])
+            self.score = np.concatenate([self.score, np.zeros(extra)])
+        first = self.count
+        self.count = needed
+        return first
+
+    def expand(self, node, board, player):
+        """Cria os filhos do nó, um por célula vazia, em ordem aleatória."""
+        moves = [row * board.size + col for row, col in board.empty_cells()]
+        self.rng.shuffle(moves)
+        wins = board.winning_cells(player)
+        first = self.allocate(len(moves))
+        children = slice(first, first + len(moves))
+        self.parent[children] = node
+        self.move[children] = moves
+        self.first_child[children] = -1
+        self.child_count[children] = 0
+        self.visits[children] = 0
+        self.score[children] = 0
+        self.terminal[children] = [self.WIN if wins >> move & 1 else self.NONTERMINAL for move in moves]
+        if len(moves) == 1 and not wins:
+            self.terminal[first] = self.DRAW  # A última célula do tabuleiro, sem vitória.
+        self.first_child[node] = first
+        self.child_count[node] = len(moves)
+
+    def rollout(self, board, player):
+        """
+        Joga batch_size partidas aleatórias a partir do tabuleiro, todas de uma vez.
+
+        Cada partida preenche as células vazias em uma ordem aleatória, alternando os jogadores; o vencedor
+        é quem completa primeiro (na ordem das jogadas) uma linha de vitória.
+
+        Retorna:
+            tuple: (vitórias de 'X', vitórias de 'O', empates).
+        """
+        cells = board.size * board.size
+        occupied = board.masks['X'] | board.masks['O']
+        empty = np.array([index for index in range(cells) if not occupied >> index & 1], dtype=np.intp)
+        games = self.batch_size
+        order = empty[self.rng.random((games, len(empty))).argsort(axis=1)]  # Células na ordem jogada.
+
+        grid = np.zeros((games, cells), dtype=np.int8)  # 1 para X, -1 para O, 0 para vazia.
+        grid[:, [index for index in range(cells) if board.masks['X'] >> index & 1]] = 1
+        grid[:, [index for index in range(cells) if board.masks['O'] >> index & 1]] = -1
+        turn = np.full((games, cells), -1, dtype=np.int32)  # Momento em que cada célula foi marcada.
+        sign = 1 if player == 'X' else -1
+        rows = np.arange(games)[:, None]
+        grid[rows, order] = np.where(np.arange(len(empty)) % 2 == 0, sign, -sign).astype(np.int8)
+        turn[rows, order] = np.arange(len(empty))
+
+        lines = self.line_cells_for(board)
+        owners = grid[:, lines]  # (partidas, linhas, células da linha)
+        completed_at = turn[:, lines].max(axis=2)  # Momento em que a linha ficou completa.
+        never = len(empty)
+        x_first = np.where((owners == 1).all(axis=2), completed_at, never).min(axis=1)
+        o_first = np.where((owners == -1).all(axis=2), completed_at, never).min(axis=1)
+        x_wins = int(np.count_nonzero(x_first < o_first))
+        o_wins = int(np.count_nonzero(o_first < x_first))
+        return x_wins, o_wins, games - x_wins - o_wins
+
+    def reuse_root(self, board, player):
+        """
+        Procura na árvore o nó da posição do tabuleiro (a raiz anterior mais as jogadas feitas desde então) e,
+        se encontrar, faz dele a nova raiz. Caso contrário, descarta a árvore.
+        """
+        node = self.find(board, player)
+        if node is None:
+            self.clear()
+        elif node != 0:
+            self.compact(node)
+
+    def find(self, board, player):
+        """Retorna o nó da posição do tabuleiro com o jogador da vez, ou None se ele não estiver na árvore."""
+        if self.root_masks is None:
+            return None
+        masks = dict(self.root_masks)
+        node, mover = 0, self.root_player
+        target = board.masks
+        while masks != target:
+            added = target[mover] & ~masks[mover]
+            if not added or self.child_count[node] == 0:
+                return None
+            first = self.first_child[node]
+            children = range(first, first + self.child_count[node])
+            node = next((child for child in children if added >> int(self.move[child]) & 1), None)
+            if node is None:
+                return None
+            masks[mover] |= 1 << int(self.move[node])
+            mover = 'O' if mover == 'X' else 'X'
+        return node if mover == player else None
+
+    def compact(self, root):
+        """Copia a subárvore do nó para o início dos vetores, fazendo dele a raiz."""
+        order = [root]
+        for node in order:  # Percurso em largura: os filhos de cada nó continuam consecutivos.
+            if self.child_count[node]:
+                first = int(self.first_child[node])
+                order.extend(range(first, first + int(self.child_count[node])))
+        order = np.array(order, dtype=np.intp)
+        new_index = np.full(self.count, -1, dtype=np.int32)
+        new_index[order] = np.arange(len(order), dtype=np.int32)
+        count = len(order)
+        for name in ('parent', 'move', 'first_child', 'child_count', 'terminal', 'visits', 'score'):
+            values = getattr(self, name)
+            values[:count] = values[order]
+        self.parent[:count] = np.where(self.parent[:count] >= 0, new_index[self.parent[:count]], -1)
+        self.parent[0] = -1
+        self.first_child[:count] = np.where(self.child_count[:count] > 0, new_index[self.first_child[:count]], -1)
+        self.count = count
+
+    def search(self, board, player, playouts=None, deadline=None, reuse=False):
+        """
+        Busca a jogada do jogador com UCT até esgotar o número de simulações ou o prazo.
+
+        Parâmetros:
+            board (Board): Posição atual (não é alterada).
+            player (str): Jogador da vez.
+            playouts (int): Número de partidas simuladas (usado quando não há prazo).
+            deadline (float): Instante (time.perf_counter) em que a busca termina.
+            reuse (bool): Aproveita a subárvore da busca anterior, se a posição estiver nela.
+
+        Retorna:
+            tuple: A jogada (linha, coluna) do filho mais visitado da raiz, ou None sem jogadas.
+        """
+        if reuse:
+            self.reuse_root(board, player)
+        else:
+            self.clear()
+        if self.count == 0:
+            self.allocate(1)
+        self.root_masks = dict(board.masks)
+        self.root_player = player
+        if self.child_count[0] == 0:
+            if not board.empty_cells():
+                return None
+            self.expand(0, board, player)
+
+        self.playouts = 0
+        self.max_depth = 0
+        opponent = {'X': 'O', 'O': 'X'}
+        log = math.log
+        while (self.playouts < playouts) if deadline is None else (time.perf_counter() < deadline):
+            # Seleção: desce pelos filhos de maior UCT até uma folha ou um fim de jogo.
+            node, turn, played = 0, player, []
+            path = [0]
+            while self.child_count[node] and not self.terminal[node]:
+                first = int(self.first_child[node])
+                last = first + int(self.child_count[node])
+                visits = self.visits[first:last]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    uct = self.score[first:last] / visits \
+                        + self.EXPLORATION * np.sqrt(log(max(self.visits[node], 1.0)) / visits)
+                uct[visits == 0] = np.inf  # Filhos nunca visitados vêm primeiro.
+                node = first + int(np.argmax(uct))
+                cell = int(self.move[node])
+                board.make_move(cell // board.size, cell % board.size, turn)
+                played.append(cell)
+                path.append(node)
+                turn = opponent[turn]
+
+            # Expansão: uma folha já visitada ganha filhos, e a simulação parte de um deles.
+            if not self.terminal[node] and self.visits[node] > 0:
+                self.expand(node, board, turn)
+                node = int(self.first_child[node])
+                cell = int(self.move[node])
+                board.make_move(cell // board.size, cell % board.size, turn)
+                played.append(cell)
+                path.append(node)
+                turn = opponent[turn]
+
+            # Simulação: o resultado de um nó terminal já é conhecido.
+            games = self.batch_size
+            mover = opponent[turn]  # Quem fez a jogada que leva ao nó.
+            if self.terminal[node] == self.WIN:
+                x_wins, o_wins, draws = (games, 0, 0) if mover == 'X' else (0, games, 0)
+            elif self.terminal[node] == self.DRAW:
+                x_wins, o_wins, draws = 0, 0, games
+            else:
+                x_wins, o_wins, draws = self.rollout(board, turn)
+            for cell in reversed(played):
+                board.undo_move(cell // board.size, cell % board.size)
+
+            # Retropropagação: cada nó soma os pontos de quem fez a jogada que leva a ele.
+            points = {'X': x_wins + 0.5 * draws, 'O': o_wins + 0.5 * draws}
+            for step, visited in enumerate(reversed(path)):
+                self.visits[visited] += games
+                self.score[visited] += points[mover if step % 2 == 0 else opponent[mover]]
+            self.playouts += games
+            self.max_depth = max(self.max_depth, len(played))
+
+        best = self.best_child(0)
+        cell = int(self.move[best])
+        return cell // board.size, cell % board.size
+
+    def best_child(self, node):
+        """Retorna o filho mais visitado do nó."""
+        first = int(self.first_child[node])
+        return first + int(np.argmax(self.visits[first:first + int(self.child_count[node])]))
+
+    def win_rate(self, node):
+        """Retorna a taxa de pontos (vitória 1, empate 0,5) de quem fez a jogada que leva ao nó."""
+        return self.score[node] / self.visits[node] if self.visits[node] else 0.0
+
+    def principal_variation(self, size):
+        """Retorna a sequência de filhos mais visitados a partir da raiz, como tuplas (linha, coluna)."""
+        pv = []
+        node = 0
+        while self.child_count[node] and self.visits[node]:
+            node = self.best_child(node)
+            if not self.visits[node]:
+                break
+            pv.append(divmod(int(self.move[node]), size))
+        return pv
+
+
+# Banco de Posições Resolvidas:
+# 
+# Um tabuleiro 4x4 tem no máximo 3^16 (cerca de 43 milhões) estados, poucos o bastante para resolver o jogo
+# inteiro com antecedência (veja solver.py). Cada posição recebe um índice denso: o tabuleiro lido como um
+# número na base 3 (0 = vazia, 1 = X, 2 = O). O arquivo guarda um byte por índice, com o valor exato da
+# posição para o jogador da vez (derrota, empate ou vitória) e a melhor jogada.
+# 
+# Só as posições canônicas (o menor índice entre as 8 rotações e reflexões) são resolvidas, então a consulta
+# converte o tabuleiro para a forma canônica e a jogada de volta para a orientação real.
+
+# In[7]:
+
+
+class PositionIndex:
+    """Índice denso (base 3) das posições de um tabuleiro, com a forma canônica pelas 8 simetrias."""
+
+    def __init__(self, size):
+        """Pré-calcula as tabelas de conversão de bitboards em índices."""
+        if size > 4:
+            raise ValueError("O índice denso só comporta tabuleiros de até 4x4 (3^16 posições).")
+        self.size = size
+        self.cells = size * size
+        self.positions = 3 ** self.cells  # Número de índices possíveis.
+        self.win_lines = Board.win_lines_for(size)
+        self.symmetries = Board.symmetries_for(size)
+        # Para cada bloco de 8 células, o valor na base 3 de cada combinação de bits marcados.
+        self.rank_chunks = tuple(
+            (shift, tuple(sum(3 ** (shift + bit) for bit in range(8) if byte >> bit & 1) for byte in range(256)))
+            for shift in range(0, self.cells, 8)
+        )
+
+    def rank(self, x_mask, o_mask):
+        """Retorna o índice na base 3 da posição."""
+        value = 0
+        for shift, table in self.rank_chunks:
+            value += table[x_mask >> shift & 0xFF] + 2 * table[o_mask >> shift & 0xFF]
+        return value
+
+    def transform(self, mask, transform):
+        """Aplica uma das 8 simetrias a uma máscara de células."""
+        result = 0
+        for shift, table in self.symmetries['chunks'][transform]:
+            result |= table[mask >> shift & 0xFF]
+        return result
+
+    def canonical(self, x_mask, o_mask):
+        """Retorna o menor índice entre as 8 simetrias da posição e a simetria que o produz."""
+        return min((self.rank(self.transform(x_mask, t), self.transform(o_mask, t)), t)
+                   for t in Board.ALL_SYMMETRIES)
+
+    def is_canonical(self, x_mask, o_mask):
+        """Verifica se nenhuma simetria produz um índice menor que o da própria posição."""
+        own = self.rank(x_mask, o_mask)
+        for t in Board.ALL_SYMMETRIES[1:]:
+            if self.rank(self.transform(x_mask, t), self.transform(o_mask, t)) < own:
+                return False
+        return True
+
+
+UNKNOWN, LOSS, DRAW, WIN = 0, 1, 2, 3  # Valores do banco, do ponto de vista do jogador da vez.
+
+
+class SolvedDatabase:
+    """
+    Leitor do banco de posições resolvidas gerado por solver.py.
+
+    O arquivo começa com um cabeçalho (identificador, versão, tamanho do tabuleiro e camadas concluídas)
+    seguido de um byte por índice: os 2 bits baixos guardam o valor e os 6 altos a melhor jogada, na
+    orientação canônica. O arquivo é mapeado em memória na primeira consulta.
+    """
+
+    MAGIC = b'TTTSOLVE'
+    VERSION = 1
+    HEADER = struct.Struct('<8sBB6xQ')  # Identificador, versão, tamanho, máscara das camadas concluídas.
+
+    def __init__(self, path):
+        """Guarda o caminho do banco; o arquivo só é aberto na primeira consulta."""
+        self.path = path
+        self.index = None
+        self.data = None
+        self.layers_done = 0
+
+    @classmethod
+    def default_path(cls, size):
+        """Caminho padrão do banco de um tabuleiro, ao lado deste arquivo."""
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), f'solved_{size}x{size}.bin')
+
+    def open(self):
+        """Lê o cabeçalho e mapeia o arquivo em memória (somente leitura)."""
+        if self.data is not None:
+            return
+        with open(self.path, 'rb') as file:
+            magic, version, size, self.layers_done = self.HEADER.unpack(file.read(self.HEADER.size))
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"{self.path} não é um banco de posições resolvidas válido.")
+        self.index = PositionIndex(size)
+        self.data = np.memmap(self.path, dtype=np.uint8, mode='r', offset=self.HEADER.size,
+                              shape=(self.index.positions,))
+
+    def lookup(self, board):
+        """
+        Consulta a posição do tabuleiro.
+
+        Retorna:
+            tuple: (valor, jogada) para o jogador da vez, com a jogada em coordenadas reais (linha, coluna)
+            ou None se a posição já terminou. Retorna None se a posição não estiver no banco.
+        """
+        self.open()
+        if board.size != self.index.size or board.win_length != board.size \
+                or not self.layers_done >> board.marks & 1:
+            return None
+        rank, transform = self.index.canonical(board.masks['X'], board.masks['O'])
+        entry = int(self.data[rank])
+        value = entry & 3
+        if value == UNKNOWN:
+            return None
+        if board.is_full() or board.check_victory('X') or board.check_victory('O'):
+            return value, None
+        return value, divmod(board.from_canonical_move(entry >> 2, transform), board.size)
+
+
+# Livro de Aberturas:
+# 
+# Nas primeiras jogadas o tabuleiro está quase vazio, a busca é a mais cara da partida e a resposta é sempre a mesma. O livro de aberturas guarda a jogada de uma busca profunda feita uma única vez (veja book.py) para cada posição das primeiras jogadas.
+# 
+# As posições são indexadas pelo hash canônico (o mesmo da tabela de transposição), então posições simétricas compartilham a entrada e a jogada é guardada na orientação canônica. O arquivo é uma lista de entradas ordenada pelo hash, mapeada em memória na primeira consulta e pesquisada por busca binária.
+# 
+# Opcionalmente, as jogadas buscadas durante as partidas em posições que ainda não estão no livro são acrescentadas a ele.
+
+# In[8]:
+
+
+class OpeningBook:
+    """
+    Livro de aberturas: hash canônico da posição -> melhor jogada, profundidade buscada e valor.
+
+    O arquivo começa com um cabeçalho (identificador, versão, tamanho do tabuleiro, marcas para vencer,
+    número de jogadas coberto e número de entradas), seguido das entradas ordenadas pelo hash.
+    """
+
+    MAGIC = b'TTTBOOK1'
+    VERSION = 1
+    HEADER = struct.Struct('<8sBBBBI')  # Identificador, versão, tamanho, marcas para vencer, jogadas, entradas.
+    ENTRY = np.dtype([('key', '<u8'), ('move', 'u1'), ('depth', 'u1'), ('value', '<i2')])
+    DEFAULT_PLIES = 4  # Jogadas cobertas por um livro criado só com o aprendizado.
+
+    def __init__(self, path, learn=False):
+        """
+        Guarda o caminho do livro; o arquivo só é aberto na primeira consulta.
+
+        Parâmetros:
+            path (str): Arquivo do livro.
+            learn (bool): Acrescenta ao livro as jogadas buscadas em posições que ele ainda não cobre.
+        """
+        self.path = path
+        self.learn = learn
+        self.entries = None  # Entradas do arquivo (mapeadas em memória).
+        self.learned = {}  # Hash canônico -> (jogada canônica, profundidade, valor), ainda não gravadas.
+        self.size = None
+        self.win_length = None
+        self.plies = self.DEFAULT_PLIES
+
+    @classmethod
+    def default_path(cls, size, win_length=None):
+        """Caminho padrão do livro de um tabuleiro, ao lado deste arquivo."""
+        suffix = f'_k{win_length}' if win_length is not None and win_length != size else ''
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), f'book_{size}x{size}{suffix}.bin')
+
+    def open(self, board):
+        """Lê o cabeçalho e mapeia as entradas em memória; sem arquivo, o livro começa vazio."""
+        if self.entries is not None:
+            return
+        if not os.path.exists(self.path):
+            self.size, self.win_length = board.size, board.win_length
+            self.entries = np.zeros(0, dtype=self.ENTRY)
+            return
+        with open(self.path, 'rb') as file:
+            magic, version, self.size, self.win_length, self.plies, count = \
+                self.HEADER.unpack(file.read(self.HEADER.size))
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(f"{self.path} não é um livro de aberturas válido.")
+        if count:
+            self.entries = np.memmap(self.path, dtype=self.ENTRY, mode='r', offset=self.HEADER.size, shape=(count,))
+        else:
+            self.entries = np.zeros(0, dtype=self.ENTRY)
+
+    def covers(self, board):
+        """Verifica se o livro é do mesmo tabuleiro e cobre o número de jogadas da posição."""
+        self.open(board)
+        return board.size == self.size and board.win_length == self.win_length and board.marks < self.plies
+
+    def lookup(self, board):
+        """
+        Consulta a posição do tabuleiro.
+
+        Retorna:
+            tuple: ((linha, coluna), profundidade, valor) para o jogador da vez, ou None se a posição não
+            estiver no livro.
+        """
+        if not self.covers(board):
+            return None
+        key, transform = board.canonical_key()
+        entry = self.learned.get(key)
+        if entry is None:
+            position = int(np.searchsorted(self.entries['key'], key))
+            if position == len(self.entries) or int(self.entries['key'][position]) != key:
+                return None
+            record = self.entries[position]
+            entry = (int(record['move']), int(record['depth']), int(record['value']))
+        move, depth, value = entry
+        return divmod(board.from_canonical_move(move, transform), board.size), depth, value
+
+    def add(self, board, move, depth, value):
+        """Acrescenta a jogada buscada na posição, se o livro a cobre e ainda não tiver uma busca tão profunda."""
+        if not self.covers(board) or move is None:
+            return
+        current = self.lookup(board)
+        if current is not None and current[1] >= depth:
+            return
+        key, transform = board.canonical_key()
+        self.learned[key] = (board.to_canonical_move(move[0] * board.size + move[1], transform), depth,
+                             int(round(value)))
+
+    def save(self):
+        """
+        Grava as jogadas aprendidas, reescrevendo o arquivo com todas as entradas.
+
+        O arquivo é lido de novo antes da gravação, para não perder o que outro jogador com o mesmo livro
+        (por exemplo, o adversário na mesma partida) gravou nesse meio-tempo.
+        """
+        if not self.learned:
+            return
+        self.entries = None  # Libera o mapeamento e relê o arquivo atual.
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as file:
+                file.seek(self.HEADER.size)
+                records = np.frombuffer(file.read(), dtype=self.ENTRY)
+            entries = {int(record['key']): (int(record['move']), int(record['depth']), int(record['value']))
+                       for record in records}
+        else:
+            entries = {}
+        for key, entry in self.learned.items():
+            if key not in entries or entries[key][1] < entry[1]:
+                entries[key] = entry
+        OpeningBook.write(self.path, self.size, self.win_length, self.plies, entries)
+        self.learned = {}
+
+    @classmethod
+    def write(cls, path, size, win_length, plies, entries):
+        """Grava um livro com as entradas (hash canônico -> (jogada canônica, profundidade, valor))."""
+        records = np.zeros(len(entries), dtype=cls.ENTRY)
+        for position, key in enumerate(sorted(entries)):
+            move, depth, value = entries[key]
+            records[position] = (key, move, depth, max(-32768, min(32767, value)))
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, size, win_length, plies, len(records)))
+            file.write(records.tobytes())
+        os.replace(temporary, path)  # Leitores com o arquivo antigo aberto não veem um livro pela metade.
+
+
+# Registro de Partidas:
+# 
+# Cada jogada pode ser gravada em um registro binário para ser analisada depois: a posição antes da jogada (bitboards e hash canônico), o jogador, a estratégia e as opções da busca, a jogada feita, o tempo gasto e os contadores da busca (nós, profundidade, valor e consultas à tabela de transposição).
+# 
+# Os registros têm tamanho fixo e ficam em um buffer em memória, gravado no arquivo de uma só vez quando enche e ao fim da partida, então a gravação quase não pesa no laço do jogo. O arquivo só recebe registros no final, e a leitura é feita em blocos de tamanho fixo, o que permite percorrer milhões de jogadas com memória limitada (veja analyze.py).
+
+# In[9]:
+
+
+class GameRecorder:
+    """
+    Registro de partidas: um registro de tamanho fixo por jogada, acrescentado ao final do arquivo.
+
+    O arquivo começa com um cabeçalho (identificador e versão), seguido dos registros. Tabuleiros de até 8x8.
+    """
+
+    MAGIC = b'TTTGAME1'
+    VERSION = 1
+    HEADER = struct.Struct('<8sB')  # Identificador, versão.
+    RECORD = np.dtype([
+        ('game', '<u4'), ('ply', 'u1'), ('size', 'u1'), ('win_length', 'u1'), ('player', 'u1'),
+        ('strategy', 'u1'), ('move', 'u1'), ('depth', 'u1'), ('search_depth', 'u1'),
+        ('key', '<u8'), ('x_mask', '<u8'), ('o_mask', '<u8'),
+        ('seconds', '<f4'), ('time_budget', '<f4'), ('value', '<f4'),
+        ('nodes', '<u4'), ('tt_hits', '<u4'), ('tt_probes', '<u4'),
+    ])
+    STRATEGIES = ('human', 'random', 'minimax', 'alpha_beta', 'solved', 'mcts')  # Códigos do campo strategy.
+    PLAYERS = ('X', 'O')  # Códigos do campo player.
+    BUFFER_RECORDS = 4096  # Registros acumulados em memória antes de cada gravação.
+    READ_RECORDS = 1 << 16  # Registros lidos por bloco.
+
+    def __init__(self, path, buffer_records=BUFFER_RECORDS):
+        """
+        Abre (ou cria) o registro; as partidas novas continuam a numeração das que já estão no arquivo.
+
+        Parâmetros:
+            path (str): Arquivo do registro.
+            buffer_records (int): Registros acumulados em memória antes de cada gravação.
+        """
+        self.path = path
+        self.buffer = np.zeros(buffer_records, dtype=self.RECORD)
+        self.count = 0  # Registros no buffer, ainda não gravados.
+        self.game = -1  # Número da partida atual.
+        self.ply = 0  # Jogadas registradas na partida atual.
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, 'wb') as file:
+                file.write(self.HEADER.pack(self.MAGIC, self.VERSION))
+            self.next_game = 0
+            return
+        with open(path, 'rb') as file:
+            GameRecorder.check_header(path, file.read(self.HEADER.size))
+            records = (os.path.getsize(path) - self.HEADER.size) // self.RECORD.itemsize
+            if records:
+                file.seek(self.HEADER.size + (records - 1) * self.RECORD.itemsize)
+                last = np.frombuffer(file.read(self.RECORD.itemsize), dtype=self.RECORD)[0]
+        self.next_game = int(last['game']) + 1 if records else 0
+
+    @classmethod
+    def check_header(cls, path, header):
+        """Levanta ValueError se o cabeçalho não for de um registro de partidas desta versão."""
+        if len(header) != cls.HEADER.size or cls.HEADER.unpack(header) != (cls.MAGIC, cls.VERSION):
+            raise ValueError(f"{path} não é um registro de partidas válido.")
+
+    def new_game(self):
+        """Começa uma nova partida no registro."""
+        self.game = self.next_game
+        self.next_game += 1
+        self.ply = 0
+
+    def record(self, board, player, move, seconds):
+        """
+        Acrescenta uma jogada ao buffer.
+
+        Parâmetros:
+            board (Board): Posição antes da jogada.
+            player (Player): Jogador que fez a jogada (os contadores da busca vêm dele, se for computador).
+            move (tuple): Jogada feita (linha, coluna).
+            seconds (float): Tempo gasto na jogada.
+        """
+        if board.size > 8:
+            raise ValueError("O registro de partidas aceita tabuleiros de até 8x8.")
+        if self.game < 0:
+            self.new_game()
+        strategy = getattr(player, 'strategy', 'human')
+        tt = getattr(player, 'tt', None)
+        searched = strategy not in ('human', 'random')
+        value = getattr(player, 'last_value', None) if searched else None
+        tt_hits = tt.hits if searched and tt is not None else 0
+        tt_probes = tt.hits + tt.misses + tt.collisions if searched and tt is not None else 0
+        # Uma única atribuição do registro inteiro (na ordem dos campos de RECORD).
+        self.buffer[self.count] = (
+            self.game, self.ply, board.size, board.win_length, self.PLAYERS.index(player.symbol),
+            self.STRATEGIES.index(strategy), move[0] * board.size + move[1],
+            min(getattr(player, 'last_depth', 0), 255) if searched else 0, getattr(player, 'depth', 0),
+            board.canonical_key()[0], board.masks['X'], board.masks['O'],
+            seconds, getattr(player, 'time_budget', None) or 0.0, value if value is not None else np.nan,
+            getattr(player, 'nodes', 0) if searched else 0, tt_hits, tt_probes)
+        self.count += 1
+        self.ply += 1
+        if self.count == len(self.buffer):
+            self.flush()
+
+    def flush(self):
+        """Grava no arquivo os registros do buffer."""
+        if self.count:
+            with open(self.path, 'ab') as file:
+                file.write(self.buffer[:self.count].tobytes())
+            self.count = 0
+
+    @classmethod
+    def read(cls, path, block_records=READ_RECORDS):
+        """
+        Percorre o registro em blocos, sem carregar o arquivo inteiro.
+
+        Retorna:
+            generator: Vetores NumPy (com o dtype RECORD) de até block_records registros.
+        """
+        with open(path, 'rb') as file:
+            cls.check_header(path, file.read(cls.HEADER.size))
+            while True:
+                data = file.read(block_records * cls.RECORD.itemsize)
+                records = np.frombuffer(data[:len(data) - len(data) % cls.RECORD.itemsize], dtype=cls.RECORD)
+                if not len(records):
+                    return
+                yield records
+
+    @classmethod
+    def position(cls, record):
+        """Recria o tabuleiro (antes da jogada) e o jogador da vez de um registro."""
+        board = Board.from_masks(int(record['size']), int(record['x_mask']), int(record['o_mask']),
+                                 int(record['win_length']))
+        return board, cls.PLAYERS[record['player']]
+
+
+# In[10]:
+
+
 class Player:
     def __init__(self, symbol):
         """Inicializa um jogador com o símbolo especificado ('X' ou 'O')."""
@@ -128,6 +1401,10 @@ class Player:
         """Interface para fazer uma jogada, a ser implementada nas subclasses."""
         pass  # Método abstrato para ser sobrescrito por classes filhas (HumanPlayer, etc.).
 
+    def new_game(self):
+        """Chamado no início de cada partida; subclasses podem descartar o estado da partida anterior."""
+        pass
+
 class HumanPlayer(Player):
     def make_move(self, board):
         """Permite que o jogador humano escolha uma célula no tabuleiro para jogar."""
@@ -152,14 +1429,371 @@ class HumanPlayer(Player):
                 print("Entrada inválida. Insira números válidos.")
 
 
-# In[4]:
+# Instrumentação da Busca:
+# 
+# SearchStats conta, em cada jogada, os nós visitados por nível, as folhas avaliadas pela heurística, as chamadas a check_victory, os cortes Alpha-Beta e os acertos da tabela de transposição, e calcula o fator de ramificação de cada nível.
+# 
+# Também pode chamar funções do usuário ao entrar e ao sair de cada nó e gravar um arquivo de pilhas agregadas (formato "folded", lido por flamegraph.pl e pelo speedscope) com o tempo gasto em cada nível, em evaluate e em check_victory.
+# 
+# A instrumentação é instalada só durante a busca, como atributos da instância do jogador e da cópia do tabuleiro que envolvem minimax, minimax_alpha_beta, evaluate e check_victory. Sem SearchStats, a busca chama os métodos originais diretamente.
+
+# In[11]:
+
+
+class SearchStats:
+    def __init__(self, on_enter=None, on_exit=None, trace_path=None):
+        """
+        Inicializa a instrumentação da busca.
+
+        Parâmetros:
+            on_enter (callable): Chamada como on_enter(board, depth) ao entrar em cada nó.
+            on_exit (callable): Chamada como on_exit(board, depth, value) ao sair de cada nó.
+            trace_path (str): Arquivo de pilhas agregadas para gráficos de chama. Quando definido, o tempo de
+                cada nível, de evaluate e de check_victory também é medido; o arquivo é recriado aqui e cada
+                jogada acrescenta as suas pilhas.
+
+        Só a parte da busca feita no processo do jogador é contada: com a busca paralela, os nós buscados
+        pelos outros processos entram apenas em ComputerPlayer.nodes.
+        """
+        self.on_enter = on_enter
+        self.on_exit = on_exit
+        self.trace_path = trace_path
+        if trace_path is not None:
+            open(trace_path, 'w').close()
+        self.strategy = None
+        self.root_marks = 0  # Marcas no tabuleiro da raiz; o nível de um nó é o número de marcas a mais.
+        self.start = 0.0
+        self.tt_start = (0, 0)
+        self.stack = []
+        self.reset()
+
+    def reset(self):
+        """Zera os contadores da jogada."""
+        self.nodes_per_ply = [0]  # Nós visitados em cada nível (a raiz é o nível 0).
+        self.interior_per_ply = [0]  # Nós com pelo menos um filho em cada nível.
+        self.cutoffs_per_ply = [0]  # Cortes Alpha-Beta em cada nível.
+        self.evaluations = 0  # Folhas avaliadas pela heurística (chamadas a evaluate).
+        self.victory_checks = 0  # Chamadas a check_victory.
+        self.tt_hits = 0  # Acertos da tabela de transposição.
+        self.tt_probes = 0  # Consultas à tabela de transposição.
+        self.evaluate_time = 0.0  # Segundos em evaluate (só com trace_path).
+        self.victory_time = 0.0  # Segundos em check_victory (só com trace_path).
+        self.seconds = 0.0  # Duração da busca.
+        self.folded = {}  # Pilha ("a;b;c") -> microssegundos gastos no próprio quadro.
+
+    def begin_move(self, player, board):
+        """Zera os contadores e instala a instrumentação no jogador e na cópia do tabuleiro da busca."""
+        self.reset()
+        self.strategy = player.strategy
+        self.root_marks = board.marks
+        if player.tt is not None:
+            self.tt_start = (player.tt.hits, player.tt.hits + player.tt.misses + player.tt.collisions)
+        timing = self.trace_path is not None
+        self.stack = [[0, 0.0, 0.0]]  # Quadro da raiz: [filhos, início, tempo dos filhos].
+        player.minimax = self.wrap_node(player.minimax, timing)
+        player.minimax_alpha_beta = self.wrap_node(player.minimax_alpha_beta, timing)
+        board.evaluate = self.wrap_leaf(board.evaluate, 'evaluate', timing)
+        board.check_victory = self.wrap_leaf(board.check_victory, 'check_victory', timing)
+        self.start = time.perf_counter()
+
+    def end_move(self, player, board):
+        """Remove a instrumentação e fecha os contadores da jogada."""
+        self.seconds = time.perf_counter() - self.start
+        for name in ('minimax', 'minimax_alpha_beta'):
+            del player.__dict__[name]  # Volta a usar os métodos da classe.
+        for name in ('evaluate', 'check_victory'):
+            del board.__dict__[name]
+        if player.tt is not None:
+            probes = player.tt.hits + player.tt.misses + player.tt.collisions
+            self.tt_hits = player.tt.hits - self.tt_start[0]
+            self.tt_probes = probes - self.tt_start[1]
+        if self.trace_path is not None:
+            root = self.seconds - self.stack[0][2]  # Tempo gasto nas funções da raiz, fora dos nós.
+            self.folded[self.strategy] = self.folded.get(self.strategy, 0) + root * 1e6
+            with open(self.trace_path, 'a', encoding='utf-8') as file:
+                for stack, micros in self.folded.items():
+                    file.write(f"{stack} {round(micros)}\n")
+
+    def frame_name(self, ply):
+        """Retorna a pilha de quadros (estratégia;nível 1;...;nível n) de um nó do nível especificado."""
+        return ';'.join([self.strategy] + [f"nível {level}" for level in range(1, ply + 1)])
+
+    def grow(self, ply):
+        """Garante que as listas por nível tenham uma posição para o nível especificado."""
+        while len(self.nodes_per_ply) <= ply:
+            self.nodes_per_ply.append(0)
+            self.interior_per_ply.append(0)
+            self.cutoffs_per_ply.append(0)
+
+    def wrap_node(self, search, timing):
+        """Envolve uma função de busca recursiva (minimax ou minimax_alpha_beta) com a contagem de nós."""
+        stack = self.stack
+
+        def node(board, depth, *args):
+            ply = board.marks - self.root_marks
+            if ply >= len(self.nodes_per_ply):
+                self.grow(ply)
+            self.nodes_per_ply[ply] += 1
+            parent = stack[-1]
+            parent[0] += 1
+            frame = [0, time.perf_counter() if timing else 0.0, 0.0]
+            stack.append(frame)
+            if self.on_enter is not None:
+                self.on_enter(board, depth)
+            value = search(board, depth, *args)
+            stack.pop()
+            if frame[0]:
+                self.interior_per_ply[ply] += 1
+            if timing:
+                elapsed = time.perf_counter() - frame[1]
+                parent[2] += elapsed
+                name = self.frame_name(ply)
+                self.folded[name] = self.folded.get(name, 0) + (elapsed - frame[2]) * 1e6
+            if self.on_exit is not None:
+                self.on_exit(board, depth, value)
+            return value
+        return node
+
+    def wrap_leaf(self, function, name, timing):
+        """Envolve evaluate ou check_victory com a contagem de chamadas (e o tempo, se timing)."""
+        def leaf(*args):
+            if name == 'evaluate':
+                self.evaluations += 1
+            else:
+                self.victory_checks += 1
+            if not timing:
+                return function(*args)
+            start = time.perf_counter()
+            result = function(*args)
+            elapsed = time.perf_counter() - start
+            self.stack[-1][2] += elapsed
+            if name == 'evaluate':
+                self.evaluate_time += elapsed
+            else:
+                self.victory_time += elapsed
+            stack = f"{self.frame_name(len(self.stack) - 1)};{name}"
+            self.folded[stack] = self.folded.get(stack, 0) + elapsed * 1e6
+            return result
+        return leaf
+
+    def record_cutoff(self, board):
+        """Conta um corte Alpha-Beta no nó do tabuleiro especificado."""
+        self.cutoffs_per_ply[board.marks - self.root_marks] += 1
+
+    @property
+    def nodes(self):
+        """Nós visitados pela busca no processo do jogador."""
+        return sum(self.nodes_per_ply)
+
+    @property
+    def cutoffs(self):
+        """Total de cortes Alpha-Beta da jogada."""
+        return sum(self.cutoffs_per_ply)
+
+    def branching_factors(self):
+        """Retorna o fator de ramificação médio de cada nível abaixo da raiz (filhos por nó com filhos)."""
+        return [self.nodes_per_ply[ply + 1] / self.interior_per_ply[ply]
+                for ply in range(1, len(self.nodes_per_ply) - 1) if self.interior_per_ply[ply]]
+
+    def as_dict(self):
+        """Retorna os contadores da última jogada em um dicionário."""
+        return {'nodes': self.nodes, 'nodes_per_ply': list(self.nodes_per_ply), 'evaluations': self.evaluations,
+                'victory_checks': self.victory_checks, 'cutoffs': self.cutoffs,
+                'cutoffs_per_ply': list(self.cutoffs_per_ply), 'branching_factors': self.branching_factors(),
+                'tt_hits': self.tt_hits, 'tt_probes': self.tt_probes, 'seconds': self.seconds,
+                'evaluate_time': self.evaluate_time, 'victory_time': self.victory_time}
+
+    def summary(self):
+        """Retorna um resumo dos contadores da última jogada."""
+        branching = ', '.join(f"{factor:.1f}" for factor in self.branching_factors())
+        text = (f"Busca: {self.nodes} nós, {self.evaluations} folhas avaliadas, {self.cutoffs} cortes, "
+                f"ramificação por nível [{branching}], {self.tt_hits}/{self.tt_probes} acertos na tabela")
+        if self.trace_path is not None:
+            text += (f", evaluate {self.evaluate_time * 1000:.1f} ms, "
+                     f"check_victory {self.victory_time * 1000:.1f} ms")
+        return text
+
+
+# In[12]:
+
+
+class SearchTimeout(Exception):
+    """Interrompe a busca quando o tempo reservado para a jogada se esgota."""
+
+
+# Estado de cada processo da busca paralela: o melhor valor já encontrado na raiz e o número da busca
+# atual (compartilhados entre todos os processos), os jogadores criados no processo, reaproveitados entre
+# tarefas para manter as tabelas de transposição aquecidas durante a busca, e a última busca de cada um.
+_worker_bound = None
+_worker_generation = None
+_worker_players = {}
+_worker_searches = {}
+
+
+def _init_search_worker(bound, generation):
+    """Inicializa um processo da busca paralela com o limite compartilhado da raiz."""
+    global _worker_bound, _worker_generation
+    _worker_bound = bound
+    _worker_generation = generation
+
+
+def _search_root_move(options, x_mask, o_mask, move, depth, alpha, time_left, generation, shared=True):
+    """
+    Busca uma jogada da raiz em um processo do pool.
+
+    Na primeira tarefa de cada busca, a tabela de transposição (salvo com keep_tt) e as heurísticas de
+    ordenação do jogador do processo são limpas, como na busca serial. Com shared=False, o limite
+    compartilhado da raiz não é consultado nem atualizado (usado na confirmação de empates).
+
+    Retorna:
+        tuple: (valor, alpha usado, nós visitados). O valor é exato se for maior que o alpha usado;
+        caso contrário, é apenas um limite superior. Retorna None no lugar do valor se o tempo acabar.
+    """
+    key = tuple(sorted(options.items()))
+    player = _worker_players.get(key)
+    if player is None:
+        player = _worker_players[key] = ComputerPlayer(**options)
+    board = Board.from_masks(player.board_size, x_mask, o_mask, player.win_length)
+    if _worker_searches.get(key) != generation:  # Primeira tarefa desta busca no processo.
+        _worker_searches[key] = generation
+        if player.tt is not None:
+            if not player.keep_tt:
+                player.tt.clear()
+            player.tt.new_search()
+        if player.ordering is not None:
+            player.ordering.clear()
+    player.nodes = 0
+    player.deadline = time.perf_counter() + time_left if time_left is not None else None
+
+    if player.strategy == 'alpha_beta' and shared:
+        alpha = max(alpha, _worker_bound.value)  # O melhor valor encontrado pelos outros processos.
+    board.make_move(move[0], move[1], player.symbol)
+    try:
+        if player.strategy == 'alpha_beta':
+            value = player.minimax_alpha_beta(board, depth, False, alpha, np.inf)
+        else:
+            value = player.minimax(board, depth, False)
+    except SearchTimeout:
+        return None, alpha, player.nodes
+    finally:
+        player.deadline = None
+
+    if value > alpha and shared:  # Valor exato: passa a ser o limite dos próximos processos.
+        with _worker_bound.get_lock():
+            # Tarefas de uma busca já encerrada (por tempo) não podem alterar o limite da busca atual.
+            if generation == _worker_generation.value and value > _worker_bound.value:
+                _worker_bound.value = value
+    return value, alpha, player.nodes
 
 
 class ComputerPlayer(Player):
-    def __init__(self, symbol, strategy):
-        """Inicializa o jogador computador com o símbolo e a estratégia especificados."""
+    TIME_CHECK_INTERVAL = 1024  # Número de nós entre duas consultas ao relógio.
+
+    def __init__(self, symbol, strategy, tt_size=1 << 20, keep_tt=False, use_symmetry=True, depth=4,
+                 time_budget=None, move_ordering=True, workers=1, board_size=4, solved_path=None, stats=None,
+                 win_length=None, playouts=20000, batch_size=64, reuse_tree=False, book_path=None, learn_book=False,
+                 threats=True, rng=None):
+        """
+        Inicializa o jogador computador com o símbolo e a estratégia especificados.
+
+        Parâmetros:
+            symbol (str): Símbolo do jogador ('X' ou 'O').
+            strategy (str): Estratégia ('random', 'minimax', 'alpha_beta', 'solved' ou 'mcts').
+            tt_size (int): Número máximo de entradas da tabela de transposição (0 desativa a tabela).
+            keep_tt (bool): Mantém a tabela de transposição entre as jogadas da mesma partida.
+            use_symmetry (bool): Trata posições simétricas como a mesma posição na tabela e busca apenas
+                uma jogada de cada grupo simétrico na raiz.
+            depth (int): Profundidade fixa da busca abaixo de cada jogada da raiz.
+            time_budget (float): Tempo máximo por jogada, em segundos. Quando definido, a busca é feita por
+                aprofundamento iterativo (profundidade 1, 2, 3...) em vez da profundidade fixa; na MCTS,
+                substitui o número fixo de simulações.
+            move_ordering (bool): Ordena as jogadas da busca Alpha-Beta (vitórias, bloqueios, killer,
+                histórico e ordem estática); sem ela as jogadas são tentadas em ordem de linha.
+            workers (int): Número de processos da busca paralela; com mais de um, as jogadas da raiz são
+                divididas entre os processos de um ProcessPoolExecutor.
+            board_size (int): Tamanho do tabuleiro, usado pelos processos da busca paralela.
+            solved_path (str): Banco de posições resolvidas da estratégia 'solved' (padrão:
+                solved_<n>x<n>.bin ao lado deste arquivo).
+            stats (SearchStats): Instrumentação da busca (contadores, funções de entrada e saída de nós e
+                arquivo de pilhas); None desativa a instrumentação.
+            win_length (int): Marcas em sequência para vencer, usado pelos processos da busca paralela (por
+                padrão, o tamanho do tabuleiro).
+            playouts (int): Partidas simuladas por jogada na MCTS, sem time_budget.
+            batch_size (int): Partidas simuladas juntas (com NumPy) a cada folha da MCTS.
+            reuse_tree (bool): Aproveita na MCTS a subárvore da posição seguinte entre as jogadas.
+            book_path (str): Livro de aberturas consultado antes das buscas Minimax e Alpha-Beta (None
+                desativa o livro).
+            learn_book (bool): Acrescenta ao livro as jogadas buscadas em posições que ele ainda não tem.
+            threats (bool): Faz a busca de ameaças antes das buscas Minimax e Alpha-Beta (vitórias, bloqueios e
+                ameaças forçadas) e usa as verificações de vitória e bloqueio dentro da árvore.
+            rng (random.Random): Gerador da estratégia 'random' e da semente da MCTS (por padrão, o módulo
+                random); um gerador próprio permite repetir partidas sem alterar o estado global.
+        """
         super().__init__(symbol)  # Chama o construtor da classe base Player.
         self.strategy = strategy  # Define a estratégia ('random', 'minimax', ou 'alpha_beta').
+        self.opponent = 'X' if symbol == 'O' else 'O'  # Símbolo do oponente.
+        self.tt = TranspositionTable(tt_size) if tt_size else None  # Tabela de transposição da busca.
+        self.keep_tt = keep_tt
+        self.use_symmetry = use_symmetry
+        self.depth = depth
+        self.time_budget = time_budget
+        self.ordering = MoveOrdering() if move_ordering else None  # Ordenação de jogadas da Alpha-Beta.
+        self.workers = workers
+        self.board_size = board_size
+        self.win_length = win_length
+        self.executor = None  # Pool de processos da busca paralela, criado na primeira jogada.
+        self.shared_bound = None  # Melhor valor da raiz compartilhado entre os processos.
+        self.search_generation = None  # Número da busca paralela atual, compartilhado entre os processos.
+        self.solved_path = solved_path
+        self.solved_db = None  # Banco de posições resolvidas, mapeado em memória na primeira jogada 'solved'.
+        if strategy == 'solved':
+            path = solved_path or SolvedDatabase.default_path(board_size)
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Banco de posições resolvidas {path} não encontrado. "
+                                        f"Gere-o com: python solver.py --size {board_size}")
+            self.solved_db = SolvedDatabase(path)
+        self.stats = stats  # Instrumentação da busca, atualizada a cada jogada.
+        self.playouts = playouts
+        self.batch_size = batch_size
+        self.reuse_tree = reuse_tree
+        self.mcts = None  # Árvore da MCTS, criada na primeira jogada de cada partida.
+        self.book = OpeningBook(book_path, learn_book) if book_path is not None else None
+        self.threats = ThreatSearch() if threats else None  # Busca de ameaças antes da busca completa.
+        self.rng = rng if rng is not None else random  # Gerador da estratégia 'random' e da semente da MCTS.
+        self.deadline = None  # Instante (time.perf_counter) em que a busca atual deve parar.
+        self.nodes = 0  # Nós visitados na última jogada.
+        self.last_depth = 0  # Profundidade da última iteração completa.
+        self.last_value = None  # Valor da jogada escolhida.
+        self.principal_variation = []  # Sequência de jogadas esperada a partir da jogada escolhida.
+
+    def new_game(self):
+        """Descarta a tabela de transposição e a árvore da MCTS da partida anterior e grava o livro aprendido."""
+        if self.tt is not None:
+            self.tt.clear()
+        self.mcts = None
+        if self.book is not None:
+            self.book.save()
+
+    def close(self):
+        """Encerra o pool de processos da busca paralela, se existir, e grava o livro aprendido."""
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+        if self.book is not None:
+            self.book.save()
+
+    def search_options(self):
+        """
+        Retorna os parâmetros usados para recriar este jogador nos processos da busca paralela.
+
+        Os processos só buscam: fora do banco, a estratégia 'solved' usa a Alpha-Beta, então eles recebem
+        essa estratégia (e não precisam do banco).
+        """
+        strategy = 'alpha_beta' if self.strategy == 'solved' else self.strategy
+        return {'symbol': self.symbol, 'strategy': strategy,
+                'tt_size': self.tt.max_entries if self.tt is not None else 0, 'keep_tt': self.keep_tt,
+                'use_symmetry': self.use_symmetry, 'move_ordering': self.ordering is not None,
+                'board_size': self.board_size, 'win_length': self.win_length, 'threats': self.threats is not None}
 
     def make_move(self, board):
         """O jogador computador faz um movimento baseado na estratégia escolhida."""
@@ -169,140 +1803,505 @@ class ComputerPlayer(Player):
             self.minimax_move(board)
         elif self.strategy == 'alpha_beta':  # Executa uma jogada usando o algoritmo Minimax com Poda Alpha-Beta.
             self.alpha_beta_move(board)
+        elif self.strategy == 'solved':  # Consulta o banco de posições resolvidas.
+            self.solved_move(board)
+        elif self.strategy == 'mcts':  # Executa uma jogada usando a Busca em Árvore de Monte Carlo.
+            self.mcts_move(board)
 
     def random_move(self, board):
         """Escolhe uma célula aleatória vazia e marca o tabuleiro com o símbolo do computador."""
         # Obtém todas as células vazias no tabuleiro.
-        available_moves = [(i, j) for i in range(board.size) for j in range(board.size) if board.board[i, j] == '']
+        available_moves = board.empty_cells()
         if available_moves:
             # Escolhe uma célula aleatória.
-            row, col = random.choice(available_moves)
+            row, col = self.rng.choice(available_moves)
             board.make_move(row, col, self.symbol)
             print(f"Computador {self.symbol} jogou na posição ({row + 1}, {col + 1}).")
 
+    def root_moves(self, board):
+        """Retorna as jogadas avaliadas na raiz (uma por grupo simétrico, se a simetria estiver ativa)."""
+        return board.unique_moves() if self.use_symmetry else board.empty_cells()
+
+    def position_key(self, board):
+        """
+        Retorna a chave da posição na tabela de transposição e a simetria que leva à orientação da chave.
+
+        Só entram as simetrias que preservam o valor de evaluate, para que posições que dividem uma
+        entrada da tabela tenham de fato o mesmo valor em qualquer profundidade.
+        """
+        return board.canonical_key() if self.use_symmetry else (board.hash, 0)
+
+    def ordered_moves(self, board, hint):
+        """Retorna as células vazias, colocando primeiro a melhor jogada conhecida da posição (se houver)."""
+        moves = board.empty_cells()
+        if hint is not None:
+            cell = divmod(hint, board.size)
+            if cell in moves:
+                moves.remove(cell)
+                moves.insert(0, cell)
+        return moves
+
+    def alpha_beta_moves(self, board, player, hint):
+        """Retorna as jogadas de um nó da Alpha-Beta na ordem em que devem ser examinadas."""
+        if self.ordering is None:
+            return self.ordered_moves(board, hint)
+        return self.ordering.order(board, player, board.empty_cells(), hint)
+
+    def count_node(self):
+        """Conta um nó visitado e interrompe a busca se o prazo da jogada tiver passado."""
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % self.TIME_CHECK_INTERVAL == 0 \
+                and time.perf_counter() >= self.deadline:
+            raise SearchTimeout()
+
     def minimax_move(self, board):
         """Escolhe a melhor jogada usando o algoritmo Minimax."""
+        self.play(board, self.search(board, self.minimax_root))
+
+    def alpha_beta_move(self, board):
+        """Escolhe a melhor jogada usando o algoritmo Minimax com Poda Alpha-Beta."""
+        self.play(board, self.search(board, self.alpha_beta_root))
+
+    def choose_move(self, board):
+        """Retorna a jogada (linha, coluna) da estratégia escolhida, sem executá-la nem exibir mensagens."""
+        if self.strategy == 'random':
+            available_moves = board.empty_cells()
+            return self.rng.choice(available_moves) if available_moves else None
+        elif self.strategy == 'minimax':
+            return self.search(board, self.minimax_root)
+        elif self.strategy == 'alpha_beta':
+            return self.search(board, self.alpha_beta_root)
+        elif self.strategy == 'solved':
+            return self.solved_choice(board)
+        elif self.strategy == 'mcts':
+            return self.mcts_choice(board)
+        raise ValueError(f"Estratégia desconhecida: {self.strategy}")
+
+    def solved_move(self, board):
+        """Escolhe a jogada consultando o banco de posições resolvidas."""
+        self.play(board, self.solved_choice(board))
+
+    def solved_choice(self, board):
+        """
+        Retorna a jogada ótima registrada no banco de posições resolvidas.
+
+        Se a posição não estiver no banco (ou o computador não for o jogador da vez previsto pelo banco,
+        em que X sempre começa), a jogada é escolhida pela busca Alpha-Beta.
+        """
+        result = None
+        if self.symbol == ('X' if board.marks % 2 == 0 else 'O'):
+            result = self.solved_db.lookup(board)
+        if result is None or result[1] is None:
+            return self.search(board, self.alpha_beta_root)
+        self.new_move()
+        self.last_depth = len(board.empty_cells())  # O valor do banco é exato até o fim do jogo.
+        self.last_value = result[0]
+        self.principal_variation = [result[1]]
+        return result[1]
+
+    def mcts_move(self, board):
+        """Escolhe a jogada usando a Busca em Árvore de Monte Carlo."""
+        self.play(board, self.mcts_choice(board))
+
+    def mcts_choice(self, board):
+        """
+        Retorna a jogada da Busca em Árvore de Monte Carlo, com o tempo máximo ou o número de simulações.
+
+        Em nodes fica o número de partidas simuladas; em last_value, a taxa de pontos estimada da jogada.
+        """
+        if self.mcts is None:
+            # A semente vem de rng, para que partidas com a mesma semente se repitam.
+            self.mcts = MonteCarloTree(self.batch_size, seed=self.rng.getrandbits(64))
+        deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        move = self.mcts.search(board, self.symbol, self.playouts, deadline, reuse=self.reuse_tree)
+        self.nodes = self.mcts.playouts
+        self.last_depth = self.mcts.max_depth
+        self.principal_variation = self.mcts.principal_variation(board.size)
+        self.last_value = self.mcts.win_rate(self.mcts.best_child(0)) if move is not None else None
+        return move
+
+    def play(self, board, move):
+        """Executa a jogada escolhida no tabuleiro e a anuncia."""
+        if move is not None:
+            board.make_move(move[0], move[1], self.symbol)
+            print(f"Computador {self.symbol} jogou na posição ({move[0] + 1}, {move[1] + 1}).")
+
+    def new_move(self):
+        """
+        Prepara o jogador para uma nova jogada: limpa a tabela de transposição (salvo com keep_tt) e as
+        heurísticas de ordenação e zera os contadores. É chamado antes de qualquer atalho (livro, busca de
+        ameaças, banco de posições), para que os resumos e o registro da jogada não mostrem os contadores
+        da jogada anterior.
+        """
+        if self.tt is not None:
+            if not self.keep_tt:
+                self.tt.clear()  # Cada jogada começa com a tabela vazia.
+            self.tt.new_search()
+        if self.ordering is not None:
+            self.ordering.clear()
+        if self.stats is not None:
+            self.stats.reset()
+        self.nodes = 0
+
+    def search(self, board, root_search):
+        """
+        Busca a melhor jogada com a função de raiz especificada, sem executá-la.
+
+        A busca é feita sobre uma cópia do tabuleiro, para que uma interrupção por tempo não deixe
+        jogadas provisórias no tabuleiro real. Posições do livro de aberturas não são buscadas.
+        """
+        self.new_move()
+        in_turn = self.symbol == ('X' if board.marks % 2 == 0 else 'O')  # O livro supõe que X começa.
+        if self.book is not None and in_turn:
+            entry = self.book.lookup(board)
+            if entry is not None:
+                move, self.last_depth, self.last_value = entry
+                self.principal_variation = [move]
+                return move
+
+        search_board = board.copy()
+        moves = self.root_moves(search_board)
+        if not moves:
+            return None
+
+        # Busca de ameaças: uma vitória ou derrota forçada dispensa a busca completa, e um bloqueio
+        # obrigatório deixa uma única jogada na raiz.
+        if self.threats is not None:
+            result, line = self.threats.solve(search_board, self.symbol)
+            self.nodes += self.threats.nodes
+            if result is not None:
+                self.last_depth = len(line)
+                self.last_value = result * board.win_score
+                self.principal_variation = line
+                return line[0]
+            if line:
+                moves = line
+        if self.ordering is not None and root_search == self.alpha_beta_root:
+            moves = self.ordering.order(search_board, self.symbol, moves)
+
+        if self.stats is not None:
+            self.stats.begin_move(self, search_board)
+        try:
+            if self.time_budget is None:
+                best_move, self.last_value = root_search(search_board, moves, self.depth)
+                self.last_depth = self.depth
+            else:
+                best_move, self.last_value = self.iterative_deepening(search_board, moves, root_search)
+        finally:
+            if self.stats is not None:
+                self.stats.end_move(self, search_board)
+        # Uma interrupção por tempo deixa jogadas provisórias na cópia da busca; a variação principal é
+        # reconstruída a partir da posição real.
+        self.principal_variation = self.extract_pv(board.copy(), best_move)
+        if self.book is not None and self.book.learn and in_turn:
+            self.book.add(board, best_move, self.last_depth, self.last_value)
+        return best_move
+
+    def iterative_deepening(self, board, moves, root_search):
+        """
+        Aprofunda a busca (1, 2, 3...) até o prazo da jogada e retorna o resultado da última iteração completa.
+
+        A melhor jogada de cada iteração passa a ser a primeira da iteração seguinte; dentro da árvore, a
+        variação principal é seguida pelas melhores jogadas guardadas na tabela de transposição.
+        """
+        deadline = time.perf_counter() + self.time_budget
+        max_depth = max(len(board.empty_cells()) - 1, 1)  # Profundidade que alcança o fim do jogo.
+        best = None
+        for depth in range(1, max_depth + 1):
+            # A primeira iteração sempre termina, para que exista uma jogada a devolver.
+            self.deadline = deadline if best is not None else None
+            try:
+                best = root_search(board, moves, depth)
+            except SearchTimeout:
+                break
+            finally:
+                self.deadline = None
+            self.last_depth = depth
+            moves = [best[0]] + [move for move in moves if move != best[0]]
+            if time.perf_counter() >= deadline or len(moves) == 1:  # Uma jogada forçada não precisa de mais.
+                break
+        return best
+
+    def extract_pv(self, board, move):
+        """Reconstrói a variação principal a partir da jogada escolhida, seguindo a tabela de transposição."""
+        if self.tt is None:
+            return [move]
+        pv = [move]
+        played = [move]
+        board.make_move(move[0], move[1], self.symbol)
+        player = self.opponent
+        while not board.is_full() and not board.check_victory(self.symbol) \
+                and not board.check_victory(self.opponent) and len(pv) <= self.last_depth:
+            key, transform = self.position_key(board)
+            entry = self.tt.peek(key)
+            if entry is None or entry[4] is None:
+                break
+            cell = divmod(board.from_canonical_move(entry[4], transform), board.size)
+            if not board.make_move(cell[0], cell[1], player):
+                break
+            pv.append(cell)
+            played.append(cell)
+            player = self.symbol if player == self.opponent else self.opponent
+        for i, j in reversed(played):
+            board.undo_move(i, j)  # Desfaz as jogadas da variação.
+        return pv
+
+    def minimax_root(self, board, moves, depth):
+        """Avalia as jogadas da raiz com o Minimax e retorna a melhor jogada e o seu valor."""
+        if self.workers > 1:
+            return self.parallel_root(board, moves, depth)
         best_value = -np.inf  # Inicializa o valor da melhor jogada como menos infinito.
         best_move = None  # Inicializa a melhor jogada como None.
 
-        # Avalia todas as células vazias no tabuleiro.
-        for i in range(board.size):
-            for j in range(board.size):
-                if board.board[i, j] == '':
-                    # Faz uma jogada provisória.
-                    board.make_move(i, j, self.symbol)
-                    move_value = self.minimax(board, 4, False)  # Chama o algoritmo Minimax.
-                    board.board[i, j] = ''  # Desfaz a jogada.
-
-                    # Atualiza a melhor jogada se necessário.
-                    if move_value > best_value:
-                        best_value = move_value
-                        best_move = (i, j)
-
-        # Faz a melhor jogada encontrada.
-        if best_move:
-            board.make_move(best_move[0], best_move[1], self.symbol)
-            print(f"Computador {self.symbol} jogou na posição ({best_move[0] + 1}, {best_move[1] + 1}).")
+        # Avalia todas as jogadas da raiz.
+        for i, j in moves:
+            # Faz uma jogada provisória.
+            board.make_move(i, j, self.symbol)
+            move_value = self.minimax(board, depth, False)  # Chama o algoritmo Minimax.
+            board.undo_move(i, j)  # Desfaz a jogada.
+
+            # Atualiza a melhor jogada se necessário.
+            if move_value > best_value:
+                best_value = move_value
+                best_move = (i, j)
+        return best_move, best_value
+
+    def alpha_beta_root(self, board, moves, depth):
+        """Avalia as jogadas da raiz com a Poda Alpha-Beta e retorna a melhor jogada e o seu valor."""
+        if self.workers > 1:
+            return self.parallel_root(board, moves, depth)
+        best_value = -np.inf
+        best_move = None
+        alpha = -np.inf
+        beta = np.inf
+
+        # Avalia todas as jogadas da raiz.
+        for i, j in moves:
+            # Faz uma jogada provisória.
+            board.make_move(i, j, self.symbol)
+            move_value = self.minimax_alpha_beta(board, depth, False, alpha, beta)
+            board.undo_move(i, j)  # Desfaz a jogada.
+
+            # Atualiza a melhor jogada se necessário. As jogadas seguintes só interessam se forem
+            # melhores, então alpha sobe junto; um valor menor ou igual a alpha é só um limite superior.
+            if move_value > best_value:
+                best_value = move_value
+                best_move = (i, j)
+            alpha = max(alpha, best_value)
+        return best_move, best_value
+
+    def parallel_root(self, board, moves, depth):
+        """
+        Divide as jogadas da raiz entre os processos do pool e retorna a melhor jogada e o seu valor.
+
+        A primeira jogada (a mais promissora) é buscada sozinha para estabelecer um limite; as demais são
+        buscadas em paralelo, cada uma começando com o melhor valor já encontrado por qualquer processo.
+        A escolha reproduz a busca serial: vence a primeira jogada, na ordem da raiz, com o maior valor.
+        """
+        if self.executor is None:
+            self.shared_bound = multiprocessing.Value('d', -np.inf)
+            self.search_generation = multiprocessing.Value('i', 0)
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_search_worker,
+                                                initargs=(self.shared_bound, self.search_generation))
+        with self.shared_bound.get_lock():
+            self.search_generation.value += 1
+            self.shared_bound.value = -np.inf
+        generation = self.search_generation.value
+        options = self.search_options()
+        x_mask, o_mask = board.masks['X'], board.masks['O']
+
+        def submit(move, alpha=-np.inf, shared=True):
+            time_left = self.deadline - time.perf_counter() if self.deadline is not None else None
+            return self.executor.submit(_search_root_move, options, x_mask, o_mask, move, depth, alpha, time_left,
+                                        generation, shared)
+
+        def collect(future):
+            value, alpha_used, nodes = future.result()
+            self.nodes += nodes
+            if value is None:
+                for pending in futures:
+                    pending.cancel()
+                raise SearchTimeout()
+            return value, alpha_used
+
+        futures = []
+        results = [collect(submit(moves[0]))]  # Irmão mais velho primeiro.
+        futures = [submit(move) for move in moves[1:]]
+        results += [collect(future) for future in futures]
+
+        # O maior valor sempre aparece como valor exato. Um valor igual ao máximo que seja só um limite
+        # superior pode esconder uma jogada pior, então é confirmado com uma janela logo abaixo do máximo,
+        # sem o limite compartilhado (que já vale o máximo e tornaria a confirmação um novo limite).
+        # Como na busca serial, vence a primeira jogada da raiz cujo valor exato é o máximo.
+        best_value = max(value for value, _ in results)
+        for move, (value, alpha_used) in zip(moves, results):
+            if value < best_value:
+                continue
+            if value > alpha_used:
+                return move, best_value
+            window = np.nextafter(best_value, -np.inf)
+            value, _ = collect(submit(move, window, shared=False))
+            if value > window:
+                return move, best_value
+        return moves[0], best_value
 
     def minimax(self, board, depth, is_max):
         """Função Minimax para encontrar o valor ótimo de uma jogada."""
+        self.count_node()
         # Condições de vitória ou fim do jogo.
         if board.check_victory(self.symbol):
-            return 10  # Retorna valor máximo se o computador vencer.
-        elif board.check_victory('X' if self.symbol == 'O' else 'O'):
-            return -10  # Retorna valor mínimo se o oponente vencer.
+            return board.win_score  # Retorna valor máximo se o computador vencer.
+        elif board.check_victory(self.opponent):
+            return -board.win_score  # Retorna valor mínimo se o oponente vencer.
         elif board.is_full() or depth == 0:
             return board.evaluate(self.symbol)  # Avalia o tabuleiro se empatar ou atingir profundidade.
 
+        # Vitória imediata, derrota certa ou bloqueio obrigatório, dentro do alcance da profundidade.
+        forced = None
+        if self.threats is not None:
+            result, forced = self.threats.immediate(board, self.symbol if is_max else self.opponent, depth)
+            if result is not None:
+                return result * board.win_score if is_max else -result * board.win_score
+
+        # Reaproveita o valor se a posição já foi buscada com profundidade suficiente; caso contrário,
+        # a melhor jogada guardada é tentada primeiro.
+        key, transform = self.position_key(board)
+        hint = None
+        if self.tt is not None:
+            entry = self.tt.probe(key)
+            if entry is not None:
+                if entry[1] >= depth and entry[3] == EXACT:
+                    return entry[2]
+                hint = board.from_canonical_move(entry[4], transform)
+
+        moves = self.ordered_moves(board, hint) if forced is None else [divmod(forced, board.size)]
+        best_move = None
         if is_max:  # Se é a vez do computador (maximizador).
             best_value = -np.inf
-            for i in range(board.size):
-                for j in range(board.size):
-                    if board.board[i, j] == '':
-                        board.make_move(i, j, self.symbol)
-                        best_value = max(best_value, self.minimax(board, depth - 1, False))
-                        board.board[i, j] = ''  # Desfaz a jogada.
-            return best_value
+            for i, j in moves:
+                board.make_move(i, j, self.symbol)
+                value = self.minimax(board, depth - 1, False)
+                board.undo_move(i, j)  # Desfaz a jogada.
+                if value > best_value:
+                    best_value, best_move = value, i * board.size + j
         else:  # Se é a vez do oponente (minimizador).
             best_value = np.inf
-            for i in range(board.size):
-                for j in range(board.size):
-                    if board.board[i, j] == '':
-                        board.make_move(i, j, 'X' if self.symbol == 'O' else 'O')
-                        best_value = min(best_value, self.minimax(board, depth - 1, True))
-                        board.board[i, j] = ''  # Desfaz a jogada.
-            return best_value
+            for i, j in moves:
+                board.make_move(i, j, self.opponent)
+                value = self.minimax(board, depth - 1, True)
+                board.undo_move(i, j)  # Desfaz a jogada.
+                if value < best_value:
+                    best_value, best_move = value, i * board.size + j
+
+        if self.tt is not None:
+            self.tt.store(key, depth, best_value, EXACT, board.to_canonical_move(best_move, transform))
+        return best_value
 
     def minimax_alpha_beta(self, board, depth, is_max, alpha, beta):
         """Função Minimax com Poda Alpha-Beta para encontrar o valor ótimo de uma jogada."""
+        self.count_node()
         # Condições de vitória ou fim do jogo.
         if board.check_victory(self.symbol):
-            return 10  # Retorna valor máximo se o computador vencer.
-        elif board.check_victory('X' if self.symbol == 'O' else 'O'):
-            return -10  # Retorna valor mínimo se o oponente vencer.
+            return board.win_score  # Retorna valor máximo se o computador vencer.
+        elif board.check_victory(self.opponent):
+            return -board.win_score  # Retorna valor mínimo se o oponente vencer.
         elif board.is_full() or depth == 0:
             return board.evaluate(self.symbol)  # Avalia o tabuleiro se empatar ou atingir profundidade.
 
+        # Vitória imediata, derrota certa ou bloqueio obrigatório, dentro do alcance da profundidade.
+        forced = None
+        if self.threats is not None:
+            result, forced = self.threats.immediate(board, self.symbol if is_max else self.opponent, depth)
+            if result is not None:
+                return result * board.win_score if is_max else -result * board.win_score
+
+        # Consulta a tabela de transposição: um valor exato encerra a busca, um limite estreita a janela.
+        key, transform = self.position_key(board)
+        alpha_orig, beta_orig = alpha, beta
+        hint = None
+        if self.tt is not None:
+            entry = self.tt.probe(key)
+            if entry is not None and entry[1] >= depth:
+                if entry[3] == EXACT:
+                    return entry[2]
+                elif entry[3] == LOWER_BOUND:
+                    alpha = max(alpha, entry[2])
+                else:
+                    beta = min(beta, entry[2])
+                if beta <= alpha:
+                    return entry[2]
+            if entry is not None:
+                hint = board.from_canonical_move(entry[4], transform)  # Melhor jogada conhecida vai primeiro.
+
+        if forced is None:
+            moves = self.alpha_beta_moves(board, self.symbol if is_max else self.opponent, hint)
+        else:
+            moves = [divmod(forced, board.size)]  # Bloqueio obrigatório.
+        best_move = None
         if is_max:  # Se é a vez do computador (maximizador).
             best_value = -np.inf
-            for i in range(board.size):
-                for j in range(board.size):
-                    if board.board[i, j] == '':
-                        board.make_move(i, j, self.symbol)
-                        best_value = max(best_value, self.minimax_alpha_beta(board, depth - 1, False, alpha, beta))
-                        board.board[i, j] = ''  # Desfaz a jogada.
-                        alpha = max(alpha, best_value)  # Atualiza o valor de alpha.
-                        if beta <= alpha:  # Poda a árvore de busca se beta <= alpha.
-                            break
-            return best_value
+            for i, j in moves:
+                board.make_move(i, j, self.symbol)
+                value = self.minimax_alpha_beta(board, depth - 1, False, alpha, beta)
+                board.undo_move(i, j)  # Desfaz a jogada.
+                if value > best_value:
+                    best_value, best_move = value, i * board.size + j
+                alpha = max(alpha, best_value)  # Atualiza o valor de alpha.
+                if beta <= alpha:  # Poda a árvore de busca se beta <= alpha.
+                    if self.ordering is not None:
+                        self.ordering.record_cutoff(board, self.symbol, (i, j), depth)
+                    if self.stats is not None:
+                        self.stats.record_cutoff(board)
+                    break
         else:  # Se é a vez do oponente (minimizador).
             best_value = np.inf
-            for i in range(board.size):
-                for j in range(board.size):
-                    if board.board[i, j] == '':
-                        board.make_move(i, j, 'X' if self.symbol == 'O' else 'O')
-                        best_value = min(best_value, self.minimax_alpha_beta(board, depth - 1, True, alpha, beta))
-                        board.board[i, j] = ''  # Desfaz a jogada.
-                        beta = min(beta, best_value)  # Atualiza o valor de beta.
-                        if beta <= alpha:  # Poda a árvore de busca se beta <= alpha.
-                            break
-            return best_value
-
-    def alpha_beta_move(self, board):
-        """Escolhe a melhor jogada usando o algoritmo Minimax com Poda Alpha-Beta."""
-        best_value = -np.inf
-        best_move = None
-        alpha = -np.inf
-        beta = np.inf
-
-        # Avalia todas as células vazias no tabuleiro.
-        for i in range(board.size):
-            for j in range(board.size):
-                if board.board[i, j] == '':
-                    # Faz uma jogada provisória.
-                    board.make_move(i, j, self.symbol)
-                    move_value = self.minimax_alpha_beta(board, 4, False, alpha, beta)
-                    board.board[i, j] = ''  # Desfaz a jogada.
-
-                    # Atualiza a melhor jogada se necessário.
-                    if move_value > best_value:
-                        best_value = move_value
-                        best_move = (i, j)
-
-        # Faz a melhor jogada encontrada.
-        if best_move:
-            board.make_move(best_move[0], best_move[1], self.symbol)
-            print(f"Computador {self.symbol} jogou na posição ({best_move[0] + 1}, {best_move[1] + 1}).")
+            for i, j in moves:
+                board.make_move(i, j, self.opponent)
+                value = self.minimax_alpha_beta(board, depth - 1, True, alpha, beta)
+                board.undo_move(i, j)  # Desfaz a jogada.
+                if value < best_value:
+                    best_value, best_move = value, i * board.size + j
+                beta = min(beta, best_value)  # Atualiza o valor de beta.
+                if beta <= alpha:  # Poda a árvore de busca se beta <= alpha.
+                    if self.ordering is not None:
+                        self.ordering.record_cutoff(board, self.opponent, (i, j), depth)
+                    if self.stats is not None:
+                        self.stats.record_cutoff(board)
+                    break
+
+        if self.tt is not None:
+            # O valor só é exato se ficou estritamente dentro da janela original.
+            if best_value <= alpha_orig:
+                flag = UPPER_BOUND
+            elif best_value >= beta_orig:
+                flag = LOWER_BOUND
+            else:
+                flag = EXACT
+            self.tt.store(key, depth, best_value, flag, board.to_canonical_move(best_move, transform))
+        return best_value
 
 
-# In[5]:
+# In[13]:
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, keep_tt=False, workers=1, instrument=False, trace_path=None, size=4, win_length=None,
+                 learn_book=False, record_path=None):
         """
         Inicializa o jogo, configurando o tabuleiro e os jogadores.
 
+        Parâmetros:
+            keep_tt (bool): Se os computadores mantêm a tabela de transposição entre as jogadas da partida.
+            workers (int): Número de processos usados pela busca de cada computador.
+            instrument (bool): Se os computadores contam nós, folhas, cortes e ramificação da busca, exibidos
+                após cada jogada.
+            trace_path (str): Arquivo de pilhas agregadas da busca, para gráficos de chama (ativa a
+                instrumentação).
+            size (int): Tamanho do tabuleiro.
+            win_length (int): Marcas em sequência para vencer (por padrão, a linha inteira).
+            learn_book (bool): Acrescenta ao livro de aberturas as jogadas buscadas nas primeiras jogadas.
+            record_path (str): Registro de partidas em que cada jogada é gravada (None desativa o registro).
+
         Atributos:
             board: Instância da classe Board que representa o tabuleiro do jogo.
             player1: Representa o primeiro jogador (Humano ou Computador).
@@ -310,18 +2309,26 @@ class Game:
             move_count: Contador de jogadas realizadas durante o jogo.
             start_time: Hora em que o jogo começou, usado para calcular a duração total do jogo.
         """
-        self.board = Board()  # Cria uma nova instância do tabuleiro
+        self.board = Board(size, win_length)  # Cria uma nova instância do tabuleiro
         self.player1 = None   # Inicializa o primeiro jogador como None
         self.player2 = None   # Inicializa o segundo jogador como None
         self.move_count = 0   # Inicializa o contador de jogadas
         self.start_time = 0   # Inicializa a hora de início do jogo
+        self.keep_tt = keep_tt  # Repassado aos jogadores computador criados em setup()
+        self.workers = workers  # Repassado aos jogadores computador criados em setup()
+        self.instrument = instrument or trace_path is not None
+        self.trace_path = trace_path
+        self.learn_book = learn_book
+        self.recorder = GameRecorder(record_path) if record_path is not None else None
 
     def setup(self):
         """
         Exibe um menu para configurar o jogo, permitindo escolher entre
         Humano vs Computador ou Computador vs Computador.
         """
-        print("Bem-vindo ao Jogo da Velha 4x4!")  # Mensagem de boas-vindas
+        print(f"Bem-vindo ao Jogo da Velha {self.board.size}x{self.board.size}!")  # Mensagem de boas-vindas
+        if self.board.win_length < self.board.size:
+            print(f"Vence quem marcar {self.board.win_length} em sequência.")
         print("Escolha o modo de jogo:")
         print("1. Humano vs Computador")
         print("2. Computador vs Computador")
@@ -330,18 +2337,61 @@ class Game:
             mode = input("Escolha (1/2): ")  # Solicita ao usuário a escolha do modo de jogo
             if mode == "1":
                 strategy = self.choose_strategy("computador")  # Escolhe a estratégia para o computador
+                time_budget = self.choose_time_budget(strategy)  # Escolhe o tempo máximo por jogada
                 self.player1 = HumanPlayer("X")  # Define o primeiro jogador como Humano
-                self.player2 = ComputerPlayer("O", strategy)  # Define o segundo jogador como Computador
+                self.player2 = self.create_computer("O", strategy, time_budget)  # Define o segundo jogador como Computador
                 break
             elif mode == "2":
                 print("Escolha a estratégia para os computadores:")
                 strategy = self.choose_strategy("computadores")  # Escolhe a estratégia para ambos os computadores
-                self.player1 = ComputerPlayer("X", strategy)  # Define o primeiro jogador como Computador
-                self.player2 = ComputerPlayer("O", strategy)  # Define o segundo jogador como Computador
+                time_budget = self.choose_time_budget(strategy)  # Escolhe o tempo máximo por jogada
+                self.player1 = self.create_computer("X", strategy, time_budget)  # Define o primeiro jogador como Computador
+                self.player2 = self.create_computer("O", strategy, time_budget)  # Define o segundo jogador como Computador
                 break
             else:
                 print("Entrada inválida. Tente novamente.")  # Mensagem de erro para entrada inválida
 
+    def create_computer(self, symbol, strategy, time_budget=None):
+        """Cria um jogador computador com as opções de busca configuradas para esta partida."""
+        stats = None
+        if self.instrument:
+            # Os dois computadores gravam no mesmo arquivo de pilhas, cada um com a sua estratégia na base.
+            stats = SearchStats(trace_path=self.trace_path)
+        # O livro de aberturas padrão é usado pelas buscas quando existe (ou quando vai ser criado aprendendo).
+        book_path = OpeningBook.default_path(self.board.size, self.board.win_length)
+        if strategy not in ('minimax', 'alpha_beta') or not (self.learn_book or os.path.exists(book_path)):
+            book_path = None
+        return ComputerPlayer(symbol, strategy, keep_tt=self.keep_tt, time_budget=time_budget,
+                              workers=self.workers, board_size=self.board.size, stats=stats,
+                              win_length=self.board.win_length, book_path=book_path, learn_book=self.learn_book)
+
+    def choose_time_budget(self, strategy):
+        """
+        Pergunta o tempo máximo por jogada das estratégias de busca.
+
+        Parâmetros:
+            strategy (str): Estratégia escolhida para o computador.
+
+        Retorna:
+            float: O tempo em segundos, ou None para manter a profundidade fixa (ou o número fixo de
+            simulações da MCTS).
+        """
+        if strategy not in ('minimax', 'alpha_beta', 'mcts'):
+            return None  # A estratégia aleatória não faz busca
+
+        fixed = "número fixo de simulações" if strategy == 'mcts' else "profundidade fixa"
+        while True:
+            answer = input(f"Tempo máximo por jogada em segundos (Enter para {fixed}): ").strip()
+            if not answer:
+                return None  # Mantém a profundidade fixa
+            try:
+                time_budget = float(answer.replace(',', '.'))
+                if time_budget > 0:
+                    return time_budget
+            except ValueError:
+                pass
+            print("Entrada inválida. Insira um número positivo.")  # Mensagem de erro para entrada inválida
+
     def choose_strategy(self, player_name="computadores"):
         """
         Exibe o menu para o usuário escolher a estratégia do computador.
@@ -356,15 +2406,24 @@ class Game:
         print("1. Random")  # Estratégia aleatória
         print("2. Minimax")  # Estratégia Minimax
         print("3. Alpha-Beta")  # Estratégia Alpha-Beta
+        print("4. Solved (banco de posições resolvidas)")  # Consulta ao banco gerado por solver.py
+        print("5. MCTS (Busca em Árvore de Monte Carlo)")  # Simulações aleatórias em lote
 
         while True:
-            choice = input("Escolha (1/2/3): ")  # Solicita a escolha da estratégia
+            choice = input("Escolha (1/2/3/4/5): ")  # Solicita a escolha da estratégia
             if choice == "1":
                 return "random"  # Retorna a estratégia aleatória
             elif choice == "2":
                 return "minimax"  # Retorna a estratégia Minimax
             elif choice == "3":
                 return "alpha_beta"  # Retorna a estratégia Alpha-Beta
+            elif choice == "4":
+                if self.board.win_length == self.board.size \
+                        and os.path.exists(SolvedDatabase.default_path(self.board.size)):
+                    return "solved"  # Retorna a estratégia do banco de posições resolvidas
+                print("Banco de posições não disponível para este tabuleiro. Gere-o com: python solver.py")
+            elif choice == "5":
+                return "mcts"  # Retorna a estratégia MCTS
             else:
                 print("Entrada inválida. Tente novamente.")  # Mensagem de erro para entrada inválida
 
@@ -377,6 +2436,10 @@ class Game:
         """
         self.start_time = time.time()  # Início do cronômetro
         current_player = self.player1  # Define o jogador atual como player1
+        self.player1.new_game()  # Descarta o estado de buscas de partidas anteriores
+        self.player2.new_game()
+        if self.recorder is not None:
+            self.recorder.new_game()
 
         while True:
             print("\nEstado atual do tabuleiro:")  # Exibe o estado atual do tabuleiro
@@ -385,11 +2448,30 @@ class Game:
             self.move_count += 1  # Incrementa o contador de jogadas
             print(f"Jogada {self.move_count}:")  # Exibe o número da jogada
             start_move_time = time.time()  # Início do tempo da jogada
+            before = self.board.copy() if self.recorder is not None else None  # Posição gravada no registro
 
             current_player.make_move(self.board)  # Solicita ao jogador atual que faça uma jogada
 
             move_duration = time.time() - start_move_time  # Tempo da jogada em segundos
-            print(f"Tempo gasto nesta jogada: {move_duration:.2f} segundos")  # Exibe o tempo gasto
+            if self.recorder is not None:
+                # A jogada é a célula que passou a ser do jogador atual.
+                cell = (self.board.masks[current_player.symbol] ^ before.masks[current_player.symbol]).bit_length() - 1
+                self.recorder.record(before, current_player, divmod(cell, self.board.size), move_duration)
+            if isinstance(current_player, ComputerPlayer) and current_player.strategy != 'random':
+                # Exibe o tempo gasto, a profundidade alcançada e os nós visitados pela busca
+                if current_player.strategy == 'mcts':
+                    print(f"Tempo gasto nesta jogada: {move_duration:.2f} segundos "
+                          f"({current_player.nodes} simulações, profundidade {current_player.last_depth}, "
+                          f"{current_player.last_value:.0%} de pontos estimados)")
+                else:
+                    print(f"Tempo gasto nesta jogada: {move_duration:.2f} segundos "
+                          f"(profundidade {current_player.last_depth}, {current_player.nodes} nós)")
+                if current_player.tt is not None and current_player.strategy != 'mcts':
+                    print(current_player.tt.summary())  # Exibe a eficiência da tabela de transposição
+                if current_player.stats is not None:
+                    print(current_player.stats.summary())  # Exibe os contadores da instrumentação
+            else:
+                print(f"Tempo gasto nesta jogada: {move_duration:.2f} segundos")  # Exibe o tempo gasto
 
             # Verifica se o jogador atual venceu ou se o tabuleiro está cheio
             if self.board.check_victory(current_player.symbol) or self.board.is_full():
@@ -406,6 +2488,11 @@ class Game:
 
         total_duration = time.time() - self.start_time  # Tempo total do jogo em segundos
         print(f"Tempo total do jogo: {total_duration:.2f} segundos")  # Exibe o tempo total
+        if self.recorder is not None:
+            self.recorder.flush()  # Grava as jogadas da partida no registro
+        for player in (self.player1, self.player2):
+            if isinstance(player, ComputerPlayer):
+                player.close()  # Encerra os processos da busca paralela e grava o livro aprendido
 
     def reset(self):
         """
@@ -416,7 +2503,7 @@ class Game:
         self.start_time = 0  # Reinicia a hora de início do jogo
 
 
-# In[7]:
+# In[14]:
 
 
 if __name__ == "__main__":
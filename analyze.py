@@ -0,0 +1,214 @@
+"""
+Analisa um registro de partidas: resumo por estratégia, reprodução de partidas e nova busca das posições.
+
+O registro (gravado por Game(record_path=...) ou por GameRecorder) é lido em blocos, então arquivos com
+milhões de jogadas são percorridos com memória limitada: os tempos entram em histogramas de tamanho fixo
+(os percentis são aproximados pelos limites das classes, com resolução de cerca de 2%) e as posições a
+buscar de novo são escolhidas durante a leitura, mantendo só as selecionadas.
+
+Com --rerun, as posições selecionadas (uma amostra aleatória ou as mais lentas, com --slowest) são
+buscadas de novo com o motor atual, com a mesma estratégia, profundidade e tempo máximo da jogada gravada.
+O resultado traz quantas jogadas mudaram e quantas ficaram mais lentas que a tolerância.
+
+Uso:
+    python analyze.py partidas.bin
+    python analyze.py partidas.bin --replay 3
+    python analyze.py partidas.bin --rerun 200 --slowest --tolerance 0.2
+"""
+
+import argparse
+import random
+import sys
+import time
+
+import numpy as np
+
+from BuscaCompetitivaTDE import ComputerPlayer, GameRecorder
+
+TIME_BINS = np.geomspace(1e-6, 1e3, 1001)  # Limites das classes dos histogramas de tempo, em segundos.
+TIME_FLOOR = 0.002  # Diferença de tempo (s) abaixo da qual jogadas muito rápidas não contam como regressão.
+SEARCHED = [GameRecorder.STRATEGIES.index(name) for name in ('minimax', 'alpha_beta', 'solved', 'mcts')]
+
+
+def percentile(histogram, q):
+    """Retorna o limite superior da classe do histograma em que fica o percentil q (0-100)."""
+    total = histogram.sum()
+    if not total:
+        return 0.0
+    position = int(np.searchsorted(np.cumsum(histogram), q / 100 * total))
+    return float(TIME_BINS[min(position + 1, len(TIME_BINS) - 1)])
+
+
+def summarize(path, block_records=GameRecorder.READ_RECORDS):
+    """Percorre o registro e retorna (número de partidas, jogadas, totais por estratégia)."""
+    games = 0
+    strategies = {}
+    moves = 0
+    for records in GameRecorder.read(path, block_records):
+        moves += len(records)
+        games += int(np.count_nonzero(records['ply'] == 0))  # Cada partida começa pela jogada 0.
+        for code in np.unique(records['strategy']):
+            selected = records[records['strategy'] == code]
+            totals = strategies.setdefault(GameRecorder.STRATEGIES[code], {
+                'moves': 0, 'seconds': 0.0, 'nodes': 0, 'depth': 0, 'tt_hits': 0, 'tt_probes': 0,
+                'histogram': np.zeros(len(TIME_BINS) - 1, dtype=np.int64)})
+            totals['moves'] += len(selected)
+            totals['seconds'] += float(selected['seconds'].sum(dtype=np.float64))
+            totals['nodes'] += int(selected['nodes'].sum(dtype=np.int64))
+            totals['depth'] += int(selected['depth'].sum(dtype=np.int64))
+            totals['tt_hits'] += int(selected['tt_hits'].sum(dtype=np.int64))
+            totals['tt_probes'] += int(selected['tt_probes'].sum(dtype=np.int64))
+            totals['histogram'] += np.histogram(np.clip(selected['seconds'], TIME_BINS[0], TIME_BINS[-1]),
+                                                TIME_BINS)[0]
+    return games, moves, strategies
+
+
+def format_summary(games, moves, strategies):
+    """Retorna o resumo por estratégia em texto para o terminal."""
+    lines = [f"{games} partidas, {moves} jogadas",
+             f"{'estratégia':<12}{'jogadas':>9}{'média':>10}{'p50':>10}{'p95':>10}{'p99':>10}"
+             f"{'nós/s':>12}{'prof.':>7}{'acertos TT':>12}"]
+    for name, totals in strategies.items():
+        count = totals['moves']
+        hit_rate = totals['tt_hits'] / totals['tt_probes'] if totals['tt_probes'] else 0.0
+        rate = totals['nodes'] / totals['seconds'] if totals['seconds'] > 0 else 0.0
+        p50, p95, p99 = (percentile(totals['histogram'], q) * 1000 for q in (50, 95, 99))
+        lines.append(f"{name:<12}{count:>9}{totals['seconds'] / count * 1000:>8.2f}ms{p50:>8.2f}ms{p95:>8.2f}ms"
+                     f"{p99:>8.2f}ms{rate:>12,.0f}{totals['depth'] / count:>7.1f}{hit_rate:>11.1%}")
+    return '\n'.join(lines)
+
+
+def select_records(path, count, slowest=False, seed=0, block_records=GameRecorder.READ_RECORDS):
+    """
+    Escolhe durante a leitura as jogadas buscadas a repetir, guardando no máximo count registros.
+
+    Cada jogada recebe uma prioridade (aleatória, ou o tempo gasto com slowest) e ficam as count de maior
+    prioridade: uma amostra uniforme sem reposição, ou as jogadas mais lentas.
+    """
+    rng = np.random.default_rng(seed)
+    kept = np.zeros(0, dtype=GameRecorder.RECORD)
+    priorities = np.zeros(0)
+    for records in GameRecorder.read(path, block_records):
+        records = records[np.isin(records['strategy'], SEARCHED)]
+        if not len(records):
+            continue
+        kept = np.concatenate([kept, records])
+        priorities = np.concatenate([priorities, records['seconds'] if slowest else rng.random(len(records))])
+        if len(kept) > count:
+            best = np.argpartition(-priorities, count - 1)[:count]
+            kept, priorities = kept[best], priorities[best]
+    return kept[np.argsort(-priorities, kind='stable')]
+
+
+def rerun(records, tolerance):
+    """
+    Busca de novo cada posição com o motor atual e retorna (totais, regressões por estratégia e jogadas).
+
+    Cada regressão é (razão entre os tempos, registro, tempo novo, jogada nova). Jogadas 'solved' de
+    tabuleiros sem banco de posições resolvidas são ignoradas, com uma mensagem.
+    """
+    players = {}
+    missing = {}  # Chave do jogador -> mensagem do banco ausente.
+    skipped = {}  # Mensagem -> jogadas ignoradas.
+    totals = {}
+    regressions = []
+    for record in records:
+        strategy = GameRecorder.STRATEGIES[record['strategy']]
+        board, symbol = GameRecorder.position(record)
+        key = (strategy, symbol, board.size, board.win_length, int(record['search_depth']),
+               float(record['time_budget']))
+        player = players.get(key)
+        if player is None and key not in missing:
+            try:
+                player = players[key] = ComputerPlayer(symbol, strategy, depth=int(record['search_depth']),
+                                                       time_budget=float(record['time_budget']) or None,
+                                                       board_size=board.size, win_length=board.win_length)
+            except FileNotFoundError as error:  # Banco de posições resolvidas ausente.
+                missing[key] = str(error)
+        if player is None:
+            skipped[missing[key]] = skipped.get(missing[key], 0) + 1
+            continue
+        player.new_game()
+        player.rng = random.Random(int(record['key']))  # MCTS: a semente depende só da posição.
+        start = time.perf_counter()
+        move = player.choose_move(board)
+        seconds = time.perf_counter() - start
+        old_seconds = float(record['seconds'])
+        data = totals.setdefault(strategy, {'positions': 0, 'changed': 0, 'slower': 0, 'old_seconds': 0.0,
+                                            'new_seconds': 0.0, 'old_nodes': 0, 'new_nodes': 0})
+        data['positions'] += 1
+        data['changed'] += move is None or move[0] * board.size + move[1] != record['move']
+        data['old_seconds'] += old_seconds
+        data['new_seconds'] += seconds
+        data['old_nodes'] += int(record['nodes'])
+        data['new_nodes'] += player.nodes
+        if seconds > old_seconds * (1 + tolerance) + TIME_FLOOR:
+            data['slower'] += 1
+            regressions.append((seconds / max(old_seconds, 1e-9), record, seconds, move))
+    for player in players.values():
+        player.close()
+    for message, count in skipped.items():
+        print(f"{count} jogadas 'solved' ignoradas: {message}")
+    regressions.sort(key=lambda item: item[0], reverse=True)
+    return totals, regressions
+
+
+def format_rerun(totals, regressions, top=10):
+    """Retorna o resultado da nova busca em texto para o terminal."""
+    lines = [f"{'estratégia':<12}{'posições':>9}{'mudaram':>9}{'lentas':>8}{'tempo antes':>13}{'tempo agora':>13}"
+             f"{'nós antes':>11}{'nós agora':>11}"]
+    for name, data in totals.items():
+        lines.append(f"{name:<12}{data['positions']:>9}{data['changed']:>9}{data['slower']:>8}"
+                     f"{data['old_seconds']:>12.3f}s{data['new_seconds']:>12.3f}s"
+                     f"{data['old_nodes']:>11}{data['new_nodes']:>11}")
+    for ratio, record, seconds, move in regressions[:top]:
+        lines.append(f"  partida {record['game']}, jogada {record['ply'] + 1}: {record['seconds'] * 1000:.2f} ms -> "
+                     f"{seconds * 1000:.2f} ms ({ratio:.1f}x), "
+                     f"jogada {divmod(int(record['move']), int(record['size']))} -> {move}")
+    return '\n'.join(lines)
+
+
+def replay(path, game):
+    """Mostra as jogadas de uma partida do registro e o tabuleiro final."""
+    board = None
+    for records in GameRecorder.read(path):
+        for record in records[records['game'] == game]:
+            board, symbol = GameRecorder.position(record)
+            row, col = divmod(int(record['move']), board.size)
+            strategy = GameRecorder.STRATEGIES[record['strategy']]
+            value = '' if np.isnan(record['value']) else f", valor {record['value']:.2f}"
+            print(f"{record['ply'] + 1:>3}. {symbol} ({strategy}) em ({row + 1}, {col + 1}): "
+                  f"{record['seconds'] * 1000:.2f} ms, {record['nodes']} nós, profundidade {record['depth']}{value}")
+            board.make_move(row, col, symbol)
+    if board is None:
+        print(f"Partida {game} não encontrada.")
+        return
+    board.display()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('path', help='Arquivo do registro de partidas.')
+    parser.add_argument('--replay', type=int, metavar='PARTIDA', help='Mostra as jogadas da partida.')
+    parser.add_argument('--rerun', type=int, default=0, metavar='N', help='Busca de novo N posições gravadas.')
+    parser.add_argument('--slowest', action='store_true', help='Busca de novo as N jogadas mais lentas.')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Aumento relativo de tempo aceito antes de contar uma regressão.')
+    parser.add_argument('--seed', type=int, default=0, help='Semente da amostra de posições.')
+    args = parser.parse_args()
+
+    if args.replay is not None:
+        replay(args.path, args.replay)
+        return
+    print(format_summary(*summarize(args.path)))
+    if args.rerun:
+        records = select_records(args.path, args.rerun, args.slowest, args.seed)
+        print(f"\nNova busca de {len(records)} posições ({'mais lentas' if args.slowest else 'amostra'}):")
+        totals, regressions = rerun(records, args.tolerance)
+        print(format_rerun(totals, regressions))
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,262 @@
+"""
+Arena sem interface: joga partidas em lote entre duas configurações de ComputerPlayer e mede força e velocidade.
+
+As partidas não usam input() nem exibem o tabuleiro; cada jogada é escolhida com ComputerPlayer.choose_move
+e cronometrada. As cores se alternam a cada partida (A joga de X nas partidas pares) e as primeiras jogadas
+podem ser sorteadas a partir de uma semente fixa, para que motores determinísticos não repitam sempre a mesma
+partida. As partidas podem ser divididas entre processos.
+
+O resultado traz vitórias, empates e derrotas de A com intervalos de confiança (Wilson, 95%), percentis
+do tempo por jogada (p50/p95/p99), nós por segundo de cada motor e partidas por segundo, e pode ser gravado
+em JSON (resumo) e CSV (uma linha por partida).
+
+Uso:
+    python arena.py --a strategy=alpha_beta,depth=4 --b strategy=random --games 200 --workers 4 \\
+        --json resultado.json --csv partidas.csv
+"""
+
+import argparse
+import ast
+import csv
+import json
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from BuscaCompetitivaTDE import Board, ComputerPlayer
+
+Z_95 = 1.959963984540054  # Quantil da normal para um intervalo de 95%.
+
+
+def parse_config(text):
+    """
+    Converte 'strategy=alpha_beta,depth=4' no dicionário de parâmetros do ComputerPlayer.
+
+    Os valores são lidos como literais Python quando possível (números, True/False, None) e como texto
+    caso contrário.
+    """
+    config = {}
+    for item in filter(None, text.split(',')):
+        key, _, value = item.partition('=')
+        try:
+            config[key.strip()] = ast.literal_eval(value.strip())
+        except (ValueError, SyntaxError):
+            config[key.strip()] = value.strip()
+    if 'strategy' not in config:
+        raise ValueError(f"Configuração sem estratégia: {text!r}")
+    return config
+
+
+def wilson_interval(successes, total, z=Z_95):
+    """Retorna o intervalo de confiança de Wilson (mínimo, máximo) para uma proporção."""
+    if total == 0:
+        return 0.0, 1.0
+    p = successes / total
+    denominator = 1 + z * z / total
+    center = (p + z * z / (2 * total)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / total + z * z / (4 * total * total)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def play_game(players, size=4, random_plies=0, rng=None, win_length=None):
+    """
+    Joga uma partida sem exibir nada e retorna o vencedor ('X', 'O' ou None) e as jogadas.
+
+    Parâmetros:
+        players (dict): Jogadores por símbolo ({'X': ..., 'O': ...}).
+        size (int): Tamanho do tabuleiro.
+        random_plies (int): Número de jogadas iniciais sorteadas (não cronometradas).
+        rng (random.Random): Gerador das jogadas sorteadas.
+        win_length (int): Marcas em sequência para vencer (por padrão, a linha inteira).
+
+    Retorna:
+        tuple: (vencedor, lista de (símbolo, linha, coluna, segundos, nós)); as jogadas sorteadas têm
+        segundos e nós iguais a None.
+    """
+    board = Board(size, win_length)
+    for player in players.values():
+        player.new_game()
+    moves = []
+    symbol = 'X'
+    while True:
+        if len(moves) < random_plies:
+            row, col = (rng or random).choice(board.empty_cells())
+            seconds, nodes = None, None
+        else:
+            player = players[symbol]
+            start = time.perf_counter()
+            row, col = player.choose_move(board)
+            seconds = time.perf_counter() - start
+            nodes = player.nodes if player.strategy != 'random' else 0
+        board.make_move(row, col, symbol)
+        moves.append((symbol, row, col, seconds, nodes))
+        if board.check_victory(symbol):
+            return symbol, moves
+        if board.is_full():
+            return None, moves
+        symbol = 'O' if symbol == 'X' else 'X'
+
+
+def play_games(config_a, config_b, game_numbers, size, random_plies, seed, win_length=None):
+    """
+    Joga as partidas de números especificados e retorna um registro por partida.
+
+    Os jogadores são criados uma vez por chamada e reutilizados entre as partidas; a partida n usa a
+    semente seed + n, então o resultado não depende de como as partidas são divididas entre processos.
+    """
+    players = {}
+    for name, config in (('A', config_a), ('B', config_b)):
+        for symbol in 'XO':
+            players[name, symbol] = ComputerPlayer(symbol, board_size=size, win_length=win_length, **config)
+    records = []
+    try:
+        for number in game_numbers:
+            # Um gerador por partida, para as jogadas de abertura, a estratégia 'random' e a semente da MCTS.
+            rng = random.Random(seed + number)
+            for player in players.values():
+                player.rng = rng
+            a_symbol = 'X' if number % 2 == 0 else 'O'
+            b_symbol = 'O' if a_symbol == 'X' else 'X'
+            winner, moves = play_game({a_symbol: players['A', a_symbol], b_symbol: players['B', b_symbol]},
+                                      size, random_plies, rng, win_length)
+            records.append({
+                'game': number,
+                'a_symbol': a_symbol,
+                'winner': winner,
+                'result': 'draw' if winner is None else 'win' if winner == a_symbol else 'loss',
+                'moves': len(moves),
+                'opening': ' '.join(f"{row}{col}" for _, row, col, seconds, _ in moves if seconds is None),
+            })
+            for name, symbol in (('a', a_symbol), ('b', b_symbol)):
+                timed = [move for move in moves if move[0] == symbol and move[3] is not None]
+                records[-1][f'{name}_times'] = [move[3] for move in timed]
+                records[-1][f'{name}_nodes'] = sum(move[4] for move in timed)
+    finally:
+        for player in players.values():
+            player.close()
+    return records
+
+
+def engine_stats(times, nodes):
+    """Resume os tempos por jogada e os nós de um motor."""
+    times = np.array(times, dtype=float)
+    total = float(times.sum())
+    p50, p95, p99 = np.percentile(times, [50, 95, 99]) if len(times) else (0.0, 0.0, 0.0)
+    return {
+        'moves': len(times),
+        'time': total,
+        'move_time_p50': float(p50),
+        'move_time_p95': float(p95),
+        'move_time_p99': float(p99),
+        'nodes': nodes,
+        'nodes_per_second': nodes / total if total > 0 else 0.0,
+    }
+
+
+def summarize(records, elapsed):
+    """Calcula o resumo da arena (do ponto de vista de A) a partir dos registros das partidas."""
+    games = len(records)
+    summary = {'games': games, 'seconds': elapsed, 'games_per_second': games / elapsed if elapsed > 0 else 0.0}
+    for result in ('win', 'draw', 'loss'):
+        count = sum(record['result'] == result for record in records)
+        low, high = wilson_interval(count, games)
+        summary[result] = {'count': count, 'rate': count / games if games else 0.0, 'ci95': [low, high]}
+    score = (summary['win']['count'] + 0.5 * summary['draw']['count']) / games if games else 0.0
+    summary['score'] = score  # Pontuação de A: vitória 1, empate 0,5.
+    for name in ('a', 'b'):
+        summary[name] = engine_stats([t for record in records for t in record[f'{name}_times']],
+                                     sum(record[f'{name}_nodes'] for record in records))
+    return summary
+
+
+def run_arena(config_a, config_b, games, workers=1, size=4, random_plies=0, seed=0, win_length=None):
+    """
+    Joga as partidas entre as configurações A e B e retorna (resumo, registros das partidas).
+
+    Parâmetros:
+        config_a, config_b (dict): Parâmetros do ComputerPlayer (sem o símbolo), como
+            {'strategy': 'alpha_beta', 'depth': 4}.
+        games (int): Número de partidas.
+        workers (int): Número de processos da arena (1 joga no processo atual).
+        size (int): Tamanho do tabuleiro.
+        random_plies (int): Jogadas iniciais sorteadas em cada partida.
+        seed (int): Semente das jogadas sorteadas e da estratégia 'random'.
+        win_length (int): Marcas em sequência para vencer (por padrão, a linha inteira).
+    """
+    start = time.perf_counter()
+    numbers = list(range(games))
+    if workers <= 1:
+        records = play_games(config_a, config_b, numbers, size, random_plies, seed, win_length)
+    else:
+        chunks = [numbers[i::workers] for i in range(workers) if numbers[i::workers]]
+        with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+            futures = [executor.submit(play_games, config_a, config_b, chunk, size, random_plies, seed, win_length)
+                       for chunk in chunks]
+            records = sorted((record for future in futures for record in future.result()),
+                             key=lambda record: record['game'])
+    summary = summarize(records, time.perf_counter() - start)
+    summary.update({'config_a': config_a, 'config_b': config_b, 'size': size, 'win_length': win_length,
+                    'random_plies': random_plies, 'seed': seed, 'workers': workers})
+    return summary, records
+
+
+def write_csv(path, records):
+    """Grava uma linha por partida, com os tempos totais e os nós de cada motor."""
+    fields = ['game', 'a_symbol', 'winner', 'result', 'moves', 'opening', 'a_time', 'b_time', 'a_nodes', 'b_nodes']
+    with open(path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        for record in records:
+            row = {field: record.get(field) for field in fields}
+            row['winner'] = record['winner'] or ''
+            row['a_time'] = f"{sum(record['a_times']):.6f}"
+            row['b_time'] = f"{sum(record['b_times']):.6f}"
+            writer.writerow(row)
+
+
+def format_summary(summary):
+    """Retorna o resumo da arena em texto para o terminal."""
+    lines = [f"{summary['games']} partidas em {summary['seconds']:.2f}s "
+             f"({summary['games_per_second']:.2f} partidas/s), pontuação de A: {summary['score']:.3f}"]
+    for result, label in (('win', 'vitórias de A'), ('draw', 'empates'), ('loss', 'derrotas de A')):
+        data = summary[result]
+        lines.append(f"  {label:<14} {data['count']:>6}  {data['rate']:6.1%}  "
+                     f"[{data['ci95'][0]:.1%}, {data['ci95'][1]:.1%}]")
+    for name in ('a', 'b'):
+        data = summary[name]
+        lines.append(f"  motor {name.upper()}: p50 {data['move_time_p50'] * 1000:.2f} ms, "
+                     f"p95 {data['move_time_p95'] * 1000:.2f} ms, p99 {data['move_time_p99'] * 1000:.2f} ms, "
+                     f"{data['nodes']} nós, {data['nodes_per_second']:,.0f} nós/s")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--a', type=parse_config, required=True,
+                        help="Configuração do motor A, como 'strategy=alpha_beta,depth=4'.")
+    parser.add_argument('--b', type=parse_config, required=True, help='Configuração do motor B.')
+    parser.add_argument('--games', type=int, default=100, help='Número de partidas.')
+    parser.add_argument('--workers', type=int, default=1, help='Número de processos da arena.')
+    parser.add_argument('--size', type=int, default=4, help='Tamanho do tabuleiro.')
+    parser.add_argument('--win-length', type=int, help='Marcas em sequência para vencer (padrão: a linha inteira).')
+    parser.add_argument('--random-plies', type=int, default=2, help='Jogadas iniciais sorteadas por partida.')
+    parser.add_argument('--seed', type=int, default=0, help='Semente das partidas.')
+    parser.add_argument('--json', help='Arquivo JSON do resumo.')
+    parser.add_argument('--csv', help='Arquivo CSV com uma linha por partida.')
+    args = parser.parse_args()
+
+    summary, records = run_arena(args.a, args.b, args.games, args.workers, args.size, args.random_plies, args.seed,
+                                 args.win_length)
+    print(format_summary(summary))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, indent=2)
+    if args.csv:
+        write_csv(args.csv, records)
+
+
+if __name__ == '__main__':
+    main()
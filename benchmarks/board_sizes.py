@@ -0,0 +1,83 @@
+"""
+Mede a busca em tabuleiros N×N com K marcas em sequência para vencer.
+
+Para cada variante, a Alpha-Beta busca o mesmo número de posições de abertura e de meio de jogo (geradas a
+partir de uma semente) com a mesma profundidade, e o script mostra os nós visitados, o tempo por jogada e
+os nós por segundo de cada tamanho. O script também confere que, em cada variante, uma vitória vale mais que
+qualquer folha avaliada pela heurística (todas as linhas do jogador, todas as células vazias e o centro) e
+termina com código 1 se não valer; o jogo original (4x4, a linha inteira) mantém a vitória valendo 10 e
+aparece só como informação.
+
+Uso:
+    python benchmarks/board_sizes.py --variants 4x4 5x4 6x4 7x4 7x5 --depth 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BuscaCompetitivaTDE import Board, ComputerPlayer  # noqa: E402
+
+
+def parse_variant(text):
+    """Converte '7x4' em (tamanho 7, 4 marcas para vencer)."""
+    size, _, win_length = text.partition('x')
+    return int(size), int(win_length or size)
+
+
+def positions_for(size, win_length, count, seed):
+    """Gera posições sem vencedor com até size marcas, a partir de uma semente fixa."""
+    rng = random.Random(f"{seed}-{size}-{win_length}")
+    positions = []
+    while len(positions) < count:
+        board = Board(size, win_length)
+        for turn in range(rng.randint(0, size)):
+            row, col = rng.choice(board.empty_cells())
+            board.make_move(row, col, 'XO'[turn % 2])
+        if not board.check_victory('X') and not board.check_victory('O'):
+            positions.append((board, 'XO'[board.marks % 2]))
+    return positions
+
+
+def heuristic_bound(size, win_length):
+    """Retorna o maior valor absoluto possível de Board.evaluate no tabuleiro."""
+    return sum(Board.cell_lines_for(size, win_length)[1]) + size * size + 5
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--variants', type=parse_variant, nargs='+',
+                        default=[(4, 4), (5, 4), (6, 4), (7, 4), (7, 5)], help="Variantes como '7x4'.")
+    parser.add_argument('--depth', type=int, default=3, help='Profundidade da busca.')
+    parser.add_argument('--positions', type=int, default=4, help='Posições por variante.')
+    parser.add_argument('--seed', type=int, default=7, help='Semente das posições.')
+    args = parser.parse_args()
+
+    print(f"Alpha-Beta, profundidade {args.depth}, {args.positions} posições por variante")
+    print(f"{'variante':<10}{'linhas':>8}{'nós':>12}{'tempo/jogada':>15}{'nós/s':>12}{'vitória':>9}"
+          f"{'heur. máx':>11}")
+    failed = False
+    for size, win_length in args.variants:
+        positions = positions_for(size, win_length, args.positions, args.seed)
+        nodes, elapsed = 0, 0.0
+        for board, symbol in positions:
+            computer = ComputerPlayer(symbol, 'alpha_beta', depth=args.depth, board_size=size, win_length=win_length)
+            start = time.perf_counter()
+            computer.choose_move(board)
+            elapsed += time.perf_counter() - start
+            nodes += computer.nodes
+        win_score, bound = Board.win_score_for(size, win_length), heuristic_bound(size, win_length)
+        original = size == win_length == 4
+        failed |= win_score <= bound and not original
+        note = '  (original)' if original else '' if win_score > bound else '  VITÓRIA NÃO SUPERA A HEURÍSTICA'
+        print(f"{f'{size}x{size} K={win_length}':<10}{len(positions[0][0].win_lines):>8}{nodes:>12}"
+              f"{elapsed / len(positions):>14.3f}s{nodes / elapsed:>12,.0f}{win_score:>9}{bound:>11}{note}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Confere a avaliação incremental e a avaliação em lote contra a heurística original do Board.evaluate.
+
+A heurística de referência abaixo é a implementação original, que percorre a matriz de strings a cada
+chamada. As posições são geradas com jogadas e desfazimentos aleatórios, para exercitar os contadores
+mantidos por make_move e undo_move. O script termina com código 1 se algum valor divergir.
+
+Uso:
+    python benchmarks/evaluate_regression.py --positions 20000 --seed 1
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BuscaCompetitivaTDE import Board  # noqa: E402
+
+
+def reference_evaluate(grid, player):
+    """Heurística original: +1/-1 por marca em cada linha, coluna e diagonal, +1 por vazia e ±5 no centro."""
+    size = len(grid)
+    opponent = 'O' if player == 'X' else 'X'
+    score = 0
+    for i in range(size):
+        score += np.sum(grid[i] == player) - np.sum(grid[i] == opponent)
+        score += np.sum(grid[:, i] == player) - np.sum(grid[:, i] == opponent)
+    score += sum(grid[i, i] == player for i in range(size)) - sum(grid[i, i] == opponent for i in range(size))
+    score += sum(grid[i, size - 1 - i] == player for i in range(size)) \
+        - sum(grid[i, size - 1 - i] == opponent for i in range(size))
+    score += np.sum(grid == '')
+    center = (size - 1) // 2  # (1, 1) no 4x4.
+    if grid[center, center] == player:
+        score += 5
+    elif grid[center, center] == opponent:
+        score -= 5
+    return int(score)
+
+
+def random_positions(count, size, seed):
+    """Gera tabuleiros aleatórios, intercalando jogadas e desfazimentos."""
+    rng = random.Random(seed)
+    board = Board(size)
+    played = []
+    for _ in range(count):
+        if played and (board.is_full() or rng.random() < 0.35):
+            row, col = played.pop(rng.randrange(len(played)))
+            board.undo_move(row, col)
+        else:
+            row, col = rng.choice(board.empty_cells())
+            board.make_move(row, col, rng.choice('XO'))
+            played.append((row, col))
+        yield board
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--positions', type=int, default=20000, help='Número de posições conferidas.')
+    parser.add_argument('--size', type=int, default=4, help='Tamanho do tabuleiro.')
+    parser.add_argument('--seed', type=int, default=1, help='Semente do gerador de posições.')
+    args = parser.parse_args()
+
+    grids, expected, incremental = [], [], []
+    for board in random_positions(args.positions, args.size, args.seed):
+        grid = board.board
+        grids.append(grid)
+        for player in 'XO':
+            expected.append(reference_evaluate(grid, player))
+            incremental.append(board.evaluate(player))
+    grids = np.stack(grids)
+    batched = np.stack([Board.evaluate_batch(grids, 'X'), Board.evaluate_batch(grids, 'O')], axis=1).ravel()
+    codes = np.where(grids == 'X', 1, np.where(grids == 'O', -1, 0)).astype(np.int8)
+    batched_codes = np.stack([Board.evaluate_batch(codes, 'X'), Board.evaluate_batch(codes, 'O')], axis=1).ravel()
+
+    failures = 0
+    for name, values in (('incremental', incremental), ('lote (strings)', batched),
+                         ('lote (códigos)', batched_codes)):
+        mismatches = int(np.sum(np.array(values) != np.array(expected)))
+        failures += mismatches
+        print(f"{name:<16} {len(expected)} avaliações, {mismatches} divergências")
+
+    # Vazão de cada caminho, em avaliações por segundo.
+    sample = grids[:2000]
+    start = time.perf_counter()
+    for grid in sample:
+        reference_evaluate(grid, 'X')
+    reference_rate = len(sample) / (time.perf_counter() - start)
+    board = next(random_positions(1, args.size, args.seed))
+    start = time.perf_counter()
+    for _ in range(100000):
+        board.evaluate('X')
+    incremental_rate = 100000 / (time.perf_counter() - start)
+    start = time.perf_counter()
+    Board.evaluate_batch(codes, 'X')
+    batch_rate = len(codes) / (time.perf_counter() - start)
+    print(f"vazão: referência {reference_rate:,.0f}/s, incremental {incremental_rate:,.0f}/s, "
+          f"lote {batch_rate:,.0f}/s")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Compara o número de nós visitados pela busca Alpha-Beta com e sem ordenação de jogadas.
+
+As duas versões buscam as mesmas posições com a mesma profundidade fixa, então a diferença de nós
+vem apenas da ordem em que as jogadas são examinadas.
+
+Uso:
+    python benchmarks/move_ordering.py --depths 2 4 6
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BuscaCompetitivaTDE import Board, ComputerPlayer  # noqa: E402
+
+# Posições de teste: sequências de jogadas (linha, coluna) alternando X e O a partir do tabuleiro vazio.
+POSITIONS = {
+    'abertura': [],
+    'abertura_centro': [(1, 1)],
+    'meio_1': [(0, 0), (1, 1), (2, 2), (3, 0), (0, 3)],
+    'meio_2': [(1, 2), (2, 1), (0, 0), (3, 3), (1, 1), (2, 2)],
+    'meio_3': [(0, 1), (1, 0), (2, 3), (3, 2), (1, 1), (2, 2), (0, 3)],
+    'final': [(0, 0), (0, 1), (0, 2), (1, 1), (1, 0), (2, 0), (2, 2), (3, 3), (1, 3), (3, 1)],
+}
+
+
+def build_board(moves):
+    """Monta o tabuleiro a partir da sequência de jogadas e retorna também o jogador da vez."""
+    board = Board()
+    for count, (row, col) in enumerate(moves):
+        board.make_move(row, col, 'XO'[count % 2])
+    return board, 'XO'[len(moves) % 2]
+
+
+def measure(moves, depth, move_ordering):
+    """Busca a posição com a Alpha-Beta e retorna (jogada, nós, segundos)."""
+    board, player = build_board(moves)
+    computer = ComputerPlayer(player, 'alpha_beta', depth=depth, move_ordering=move_ordering)
+    start = time.perf_counter()
+    move = computer.choose_move(board)
+    return move, computer.nodes, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--depths', type=int, nargs='+', default=[2, 4], help='Profundidades a comparar.')
+    args = parser.parse_args()
+
+    print(f"{'posição':<16}{'prof.':>6}{'nós sem ordem':>16}{'nós com ordem':>16}{'redução':>10}"
+          f"{'tempo sem':>12}{'tempo com':>12}")
+    totals = [0, 0]
+    for name, moves in POSITIONS.items():
+        for depth in args.depths:
+            _, plain_nodes, plain_time = measure(moves, depth, move_ordering=False)
+            _, ordered_nodes, ordered_time = measure(moves, depth, move_ordering=True)
+            totals[0] += plain_nodes
+            totals[1] += ordered_nodes
+            print(f"{name:<16}{depth:>6}{plain_nodes:>16}{ordered_nodes:>16}"
+                  f"{plain_nodes / max(ordered_nodes, 1):>9.1f}x{plain_time:>11.3f}s{ordered_time:>11.3f}s")
+    print(f"{'total':<22}{totals[0]:>16}{totals[1]:>16}{totals[0] / max(totals[1], 1):>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
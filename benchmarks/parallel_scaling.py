@@ -0,0 +1,82 @@
+"""
+Mede a escalabilidade da busca paralela da raiz com 1, 2, 4 e 8 processos.
+
+Todas as configurações buscam o mesmo conjunto fixo de posições de meio de jogo na mesma profundidade.
+Cada configuração é repetida algumas vezes (o tempo mostrado é o da mais rápida); o script confere que
+todas as repetições devolvem as mesmas jogadas que a busca serial e termina com código 1 se alguma divergir.
+
+Uso:
+    python benchmarks/parallel_scaling.py --workers 1 2 4 8 --depth 6 --repeat 3
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BuscaCompetitivaTDE import Board, ComputerPlayer  # noqa: E402
+
+
+def midgame_positions(count, seed):
+    """Gera posições de meio de jogo (4 a 6 marcas, sem vencedor) a partir de uma semente fixa."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = Board()
+        for turn in range(rng.randint(4, 6)):
+            row, col = rng.choice(board.empty_cells())
+            board.make_move(row, col, 'XO'[turn % 2])
+        if not board.check_victory('X') and not board.check_victory('O'):
+            positions.append((board, 'XO'[board.marks % 2]))
+    return positions
+
+
+def run(positions, strategy, depth, workers):
+    """Busca todas as posições e retorna (jogadas, nós, segundos)."""
+    players = {symbol: ComputerPlayer(symbol, strategy, depth=depth, workers=workers) for symbol in 'XO'}
+    for player in players.values():
+        player.choose_move(midgame_positions(1, 0)[0][0])  # Cria o pool de processos antes de medir.
+
+    moves, nodes = [], 0
+    start = time.perf_counter()
+    for board, symbol in positions:
+        moves.append(players[symbol].choose_move(board))
+        nodes += players[symbol].nodes
+    elapsed = time.perf_counter() - start
+    for player in players.values():
+        player.close()
+    return moves, nodes, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='Números de processos.')
+    parser.add_argument('--depth', type=int, default=6, help='Profundidade da busca.')
+    parser.add_argument('--strategy', choices=['alpha_beta', 'minimax'], default='alpha_beta')
+    parser.add_argument('--positions', type=int, default=8, help='Número de posições de meio de jogo.')
+    parser.add_argument('--seed', type=int, default=42, help='Semente das posições.')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetições de cada configuração.')
+    args = parser.parse_args()
+
+    positions = midgame_positions(args.positions, args.seed)
+    print(f"{len(positions)} posições, {args.strategy}, profundidade {args.depth}, {os.cpu_count()} CPUs")
+    print(f"{'processos':>10}{'tempo':>10}{'aceleração':>12}{'nós':>10}{'nós/s':>12}  mesmas jogadas")
+    serial_moves, serial_time = None, None
+    failed = False
+    for workers in args.workers:
+        runs = [run(positions, args.strategy, args.depth, workers) for _ in range(args.repeat)]
+        moves, nodes, elapsed = min(runs, key=lambda result: result[2])
+        if serial_moves is None:
+            serial_moves, serial_time = moves, elapsed
+        same = all(result[0] == serial_moves for result in runs)
+        failed |= not same
+        print(f"{workers:>10}{elapsed:>9.2f}s{serial_time / elapsed:>11.2f}x{nodes:>10}{nodes / elapsed:>12,.0f}"
+              f"  {'sim' if same else 'NÃO'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Teste de carga do servidor do motor: várias conexões simultâneas pedindo jogadas em posições fixas.
+
+Cada conexão envia um pedido por vez e espera a resposta antes do seguinte (carga em malha fechada). As
+posições (sem vencedor, de abertura a meio de jogo) são geradas a partir de uma semente, e o mesmo conjunto
+é enviado a cada rodada, para que a diferença entre a primeira rodada (processos frios) e as seguintes
+(tabelas de transposição aquecidas) apareça no resultado. Para cada rodada são mostrados os pedidos por
+segundo e os percentis p50/p95/p99 da latência de ponta a ponta.
+
+O servidor deve estar no ar (python server.py ...).
+
+Uso:
+    python benchmarks/server_load.py --port 8765 --connections 32 --requests 50 --depth 4 --rounds 2
+    python benchmarks/server_load.py --unix /tmp/velha.sock --strategy mcts --playouts 2000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BuscaCompetitivaTDE import Board  # noqa: E402
+
+
+def load_positions(size, win_length, count, seed):
+    """Gera posições sem vencedor com até 2 × size marcas, no texto do protocolo do servidor."""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board = Board(size, win_length)
+        for turn in range(rng.randint(0, 2 * size)):
+            row, col = rng.choice(board.empty_cells())
+            board.make_move(row, col, 'XO'[turn % 2])
+        if not board.check_victory('X') and not board.check_victory('O') and not board.is_full():
+            positions.append(''.join(board.get(row, col) or '.' for row in range(size) for col in range(size)))
+    return positions
+
+
+async def connect(args):
+    """Abre uma conexão com o servidor (socket Unix ou TCP)."""
+    if args.unix:
+        return await asyncio.open_unix_connection(args.unix)
+    return await asyncio.open_connection(args.host, args.port)
+
+
+async def run_connection(args, number, positions, latencies, errors):
+    """Envia os pedidos de uma conexão, um por vez, e registra a latência de cada resposta."""
+    reader, writer = await connect(args)
+    try:
+        for index in range(args.requests):
+            request = {'id': index, 'board': positions[(number * args.requests + index) % len(positions)],
+                       'strategy': args.strategy, 'depth': args.depth, 'playouts': args.playouts}
+            if args.win_length:
+                request['win_length'] = args.win_length
+            if args.time_budget:
+                request['time_budget'] = args.time_budget
+            start = time.perf_counter()
+            writer.write(json.dumps(request).encode() + b'\n')
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - start)
+            if 'error' in response or response.get('id') != index:
+                errors.append(response.get('error', 'resposta de outro pedido'))
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_round(args, positions):
+    """Roda uma rodada com todas as conexões e retorna (latências, erros, segundos)."""
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_connection(args, number, positions, latencies, errors)
+                           for number in range(args.connections)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1', help='Endereço TCP do servidor.')
+    parser.add_argument('--port', type=int, default=8765, help='Porta TCP do servidor.')
+    parser.add_argument('--unix', help='Socket Unix do servidor (substitui o TCP).')
+    parser.add_argument('--connections', type=int, default=32, help='Conexões simultâneas.')
+    parser.add_argument('--requests', type=int, default=50, help='Pedidos por conexão em cada rodada.')
+    parser.add_argument('--rounds', type=int, default=2, help='Rodadas com as mesmas posições.')
+    parser.add_argument('--strategy', default='alpha_beta', help='Estratégia pedida ao servidor.')
+    parser.add_argument('--depth', type=int, default=4, help='Profundidade das buscas.')
+    parser.add_argument('--time-budget', type=float, help='Tempo máximo por jogada (substitui a profundidade).')
+    parser.add_argument('--playouts', type=int, default=2000, help='Simulações por jogada da MCTS.')
+    parser.add_argument('--size', type=int, default=4, help='Tamanho do tabuleiro.')
+    parser.add_argument('--win-length', type=int, help='Marcas em sequência para vencer (padrão: a linha inteira).')
+    parser.add_argument('--positions', type=int, default=200, help='Posições distintas enviadas.')
+    parser.add_argument('--seed', type=int, default=11, help='Semente das posições.')
+    args = parser.parse_args()
+
+    positions = load_positions(args.size, args.win_length, args.positions, args.seed)
+    print(f"{args.connections} conexões × {args.requests} pedidos, {args.strategy}, {len(positions)} posições")
+    print(f"{'rodada':<8}{'pedidos':>9}{'erros':>7}{'pedidos/s':>12}{'p50':>10}{'p95':>10}{'p99':>10}{'máx':>10}")
+    failed = False
+    for number in range(1, args.rounds + 1):
+        latencies, errors, seconds = asyncio.run(run_round(args, positions))
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+        print(f"{number:<8}{len(latencies):>9}{len(errors):>7}{len(latencies) / seconds:>12,.1f}"
+              f"{p50:>8.1f}ms{p95:>8.1f}ms{p99:>8.1f}ms{max(latencies) * 1000:>8.1f}ms")
+        for error in sorted(set(errors)):
+            print(f"  erro: {error}")
+        failed = failed or bool(errors)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
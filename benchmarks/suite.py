@@ -0,0 +1,209 @@
+"""
+Conjunto de benchmarks reproduzível das primitivas do Board e das buscas Minimax e Alpha-Beta.
+
+Cada caso roda sobre um conjunto fixo de posições de abertura, meio de jogo e final, geradas a partir de
+uma semente. Para cada caso são medidos o tempo (o menor entre as repetições), os nós visitados (ou as
+chamadas, nas primitivas), os nós por segundo e o pico de memória (tracemalloc, em uma execução à parte).
+
+Os resultados podem ser gravados como linha de base (--save) e são comparados com ela nas execuções
+seguintes: o script termina com código 1 se algum caso ficar mais lento ou usar mais memória que a
+tolerância, ou se uma busca visitar mais nós que na linha de base. A linha de base registra tempos da
+máquina em que foi gravada, então deve ser gerada de novo em cada máquina.
+
+Uso:
+    python benchmarks/suite.py --save
+    python benchmarks/suite.py --tolerance 0.2
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BuscaCompetitivaTDE import Board, ComputerPlayer  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+SEARCHES = ('minimax', 'alpha_beta')  # Estratégias medidas com buscas completas.
+TIME_FLOOR = 0.002  # Diferença de tempo (s) abaixo da qual casos muito curtos não acusam regressão.
+PHASES = {'abertura': (0, 2), 'meio': (5, 7), 'final': (10, 12)}  # Número de marcas de cada fase.
+
+
+def phase_positions(phase, count, seed, size=4):
+    """Gera posições sem vencedor da fase especificada, com o jogador da vez."""
+    low, high = PHASES[phase]
+    rng = random.Random(f"{seed}-{phase}")
+    positions = []
+    while len(positions) < count:
+        board = Board(size)
+        for turn in range(rng.randint(low, high)):
+            row, col = rng.choice(board.empty_cells())
+            board.make_move(row, col, 'XO'[turn % 2])
+        if not board.check_victory('X') and not board.check_victory('O'):
+            positions.append((board, 'XO'[board.marks % 2]))
+    return positions
+
+
+def bench_make_undo(positions, calls):
+    """Faz e desfaz cada jogada vazia das posições até completar o número de chamadas."""
+    done = 0
+    while done < calls:
+        for board, player in positions:
+            for row, col in board.empty_cells():
+                board.make_move(row, col, player)
+                board.undo_move(row, col)
+                done += 1
+    return done
+
+
+def bench_check_victory(positions, calls):
+    """Chama check_victory para os dois jogadores."""
+    done = 0
+    while done < calls:
+        for board, _ in positions:
+            board.check_victory('X')
+            board.check_victory('O')
+            done += 2
+    return done
+
+
+def bench_is_full(positions, calls):
+    """Chama is_full repetidamente."""
+    done = 0
+    while done < calls:
+        for board, _ in positions:
+            board.is_full()
+            done += 1
+    return done
+
+
+def bench_evaluate(positions, calls):
+    """Chama evaluate para os dois jogadores."""
+    done = 0
+    while done < calls:
+        for board, _ in positions:
+            board.evaluate('X')
+            board.evaluate('O')
+            done += 2
+    return done
+
+
+def bench_search(strategy, depth):
+    """Cria o caso de uma busca completa: retorna uma função que busca todas as posições e soma os nós."""
+    def run(positions, calls):
+        nodes = 0
+        for board, player in positions:
+            computer = ComputerPlayer(player, strategy, depth=depth)
+            computer.choose_move(board)
+            nodes += computer.nodes
+        return nodes
+    return run
+
+
+def cases(depth):
+    """Retorna os casos do conjunto: (nome, função)."""
+    primitives = [('make_undo', bench_make_undo), ('check_victory', bench_check_victory),
+                  ('is_full', bench_is_full), ('evaluate', bench_evaluate)]
+    return primitives + [(strategy, bench_search(strategy, depth)) for strategy in SEARCHES]
+
+
+def measure(function, positions, calls, repeat):
+    """Retorna (menor tempo, nós, pico de memória em bytes) do caso."""
+    best = float('inf')
+    nodes = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        nodes = function(positions, calls)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    function(positions, calls)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, nodes, peak
+
+
+def run_suite(depth, calls, repeat, seed, count):
+    """Roda todos os casos em todas as fases e retorna os resultados por chave 'caso/fase'."""
+    results = {}
+    for phase in PHASES:
+        positions = phase_positions(phase, count, seed)
+        for name, function in cases(depth):
+            seconds, nodes, peak = measure(function, positions, calls, repeat)
+            results[f"{name}/{phase}"] = {'seconds': seconds, 'nodes': nodes,
+                                          'nodes_per_second': nodes / seconds if seconds > 0 else 0.0,
+                                          'peak_memory': peak}
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Compara os resultados com a linha de base e retorna a lista de regressões encontradas."""
+    regressions = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        if result['seconds'] > reference['seconds'] * (1 + tolerance) + TIME_FLOOR:
+            regressions.append(f"{key}: tempo {result['seconds']:.4f}s > {reference['seconds']:.4f}s "
+                               f"na linha de base")
+        if result['peak_memory'] > reference['peak_memory'] * (1 + tolerance):
+            regressions.append(f"{key}: memória {result['peak_memory']} B > {reference['peak_memory']} B "
+                               f"na linha de base")
+        if key.split('/')[0] in SEARCHES and result['nodes'] > reference['nodes']:
+            regressions.append(f"{key}: {result['nodes']} nós > {reference['nodes']} na linha de base")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--depth', type=int, default=3, help='Profundidade das buscas.')
+    parser.add_argument('--calls', type=int, default=20000, help='Chamadas por caso das primitivas.')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetições de cada caso (vale o menor tempo).')
+    parser.add_argument('--positions', type=int, default=3, help='Posições por fase.')
+    parser.add_argument('--seed', type=int, default=2024, help='Semente das posições.')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Arquivo da linha de base.')
+    parser.add_argument('--save', action='store_true', help='Grava os resultados como nova linha de base.')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Aumento relativo de tempo e memória aceito antes de acusar regressão.')
+    args = parser.parse_args()
+
+    results = run_suite(args.depth, args.calls, args.repeat, args.seed, args.positions)
+    # Parâmetros que mudam os resultados: a comparação só vale contra uma linha de base com os mesmos.
+    settings = {name: getattr(args, name) for name in ('depth', 'calls', 'repeat', 'positions', 'seed')}
+    baseline = {}
+    if not os.path.exists(args.baseline):
+        print("Sem linha de base; grave uma com --save.")
+    else:
+        with open(args.baseline, encoding='utf-8') as file:
+            stored = json.load(file)
+        if stored['settings'] == settings:
+            baseline = stored['results']
+        else:
+            print("Linha de base gravada com outros parâmetros; comparação ignorada.")
+
+    print(f"{'caso':<24}{'tempo':>11}{'nós':>10}{'nós/s':>14}{'memória':>12}{'base':>11}")
+    for key, result in results.items():
+        reference = baseline.get(key)
+        change = f"{result['seconds'] / reference['seconds'] - 1:+.0%}" if reference else '-'
+        print(f"{key:<24}{result['seconds']:>10.4f}s{result['nodes']:>10}{result['nodes_per_second']:>14,.0f}"
+              f"{result['peak_memory'] / 1024:>9.1f} KB{change:>11}")
+
+    if args.save:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump({'settings': settings, 'results': results}, file, indent=2)
+        print(f"Linha de base gravada em {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nREGRESSÕES ({len(regressions)}):")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
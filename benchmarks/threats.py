@@ -0,0 +1,95 @@
+"""
+Compara a latência e os nós das buscas com e sem a busca de ameaças em posições táticas de meio de jogo.
+
+As posições (geradas a partir de uma semente) são separadas pelo que a busca de ameaças encontra: vitória ou
+derrota provada (a busca completa é dispensada), bloqueio obrigatório (uma jogada na raiz) e posições
+tranquilas (só as verificações dentro da árvore atuam). Para cada grupo são somados os nós e o tempo das
+duas versões, e contadas as jogadas diferentes; com a busca de ameaças, uma vitória provada além da
+profundidade da busca pode mudar a jogada.
+
+Uso:
+    python benchmarks/threats.py --variants 4x4 5x4 --depth 4 --positions 40
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BuscaCompetitivaTDE import Board, ComputerPlayer, ThreatSearch  # noqa: E402
+
+
+def parse_variant(text):
+    """Converte '5x4' em (tamanho 5, 4 marcas para vencer)."""
+    size, _, win_length = text.partition('x')
+    return int(size), int(win_length or size)
+
+
+def tactical_positions(size, win_length, count, seed):
+    """Gera posições de meio de jogo sem vencedor em que algum jogador tem vitória imediata ou ameaça."""
+    rng = random.Random(f"{seed}-{size}-{win_length}")
+    threats = ThreatSearch()
+    positions = []
+    while len(positions) < count:
+        board = Board(size, win_length)
+        for turn in range(rng.randint(size, 2 * size + 1)):
+            row, col = rng.choice(board.empty_cells())
+            board.make_move(row, col, 'XO'[turn % 2])
+        if board.check_victory('X') or board.check_victory('O') or board.is_full():
+            continue
+        if any(board.winning_cells(player) or threats.threat_moves(board, player) for player in 'XO'):
+            positions.append((board, 'XO'[board.marks % 2]))
+    return positions
+
+
+def classify(board, player):
+    """Retorna o grupo da posição: 'provada', 'forçada' ou 'tranquila'."""
+    result, line = ThreatSearch().solve(board.copy(), player)
+    if result is not None:
+        return 'provada'
+    return 'forçada' if line else 'tranquila'
+
+
+def measure(board, player, strategy, depth, threats):
+    """Busca a posição e retorna (jogada, nós, segundos)."""
+    computer = ComputerPlayer(player, strategy, depth=depth, board_size=board.size, win_length=board.win_length,
+                              threats=threats)
+    start = time.perf_counter()
+    move = computer.choose_move(board)
+    return move, computer.nodes, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--variants', type=parse_variant, nargs='+', default=[(4, 4), (5, 4)],
+                        help="Variantes como '5x4'.")
+    parser.add_argument('--strategy', default='alpha_beta', help="Busca comparada ('alpha_beta' ou 'minimax').")
+    parser.add_argument('--depth', type=int, default=4, help='Profundidade da busca.')
+    parser.add_argument('--positions', type=int, default=40, help='Posições por variante.')
+    parser.add_argument('--seed', type=int, default=3, help='Semente das posições.')
+    args = parser.parse_args()
+
+    print(f"{args.strategy}, profundidade {args.depth}, {args.positions} posições por variante")
+    print(f"{'variante':<10}{'grupo':<11}{'pos.':>5}{'nós sem':>11}{'nós com':>11}{'tempo sem':>12}"
+          f"{'tempo com':>12}{'ganho':>8}{'difer.':>8}")
+    for size, win_length in args.variants:
+        groups = {}
+        for board, player in tactical_positions(size, win_length, args.positions, args.seed):
+            plain_move, plain_nodes, plain_time = measure(board, player, args.strategy, args.depth, False)
+            move, nodes, seconds = measure(board, player, args.strategy, args.depth, True)
+            totals = groups.setdefault(classify(board, player), [0, 0, 0, 0.0, 0.0, 0])
+            for number, value in enumerate((1, plain_nodes, nodes, plain_time, seconds, move != plain_move)):
+                totals[number] += value
+        for name in ('provada', 'forçada', 'tranquila'):
+            if name not in groups:
+                continue
+            count, plain_nodes, nodes, plain_time, seconds, changed = groups[name]
+            print(f"{f'{size}x{size} K={win_length}':<10}{name:<11}{count:>5}{plain_nodes:>11}{nodes:>11}"
+                  f"{plain_time:>11.3f}s{seconds:>11.3f}s{plain_time / max(seconds, 1e-9):>7.1f}x{changed:>8}")
+
+
+if __name__ == '__main__':
+    main()
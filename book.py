@@ -0,0 +1,74 @@
+"""
+Gera o livro de aberturas: busca a fundo cada posição das primeiras jogadas e grava a melhor jogada.
+
+As posições são todas as que podem surgir nas primeiras jogadas (uma por classe de simetria, sem vencedor),
+começando pelo tabuleiro vazio. Cada uma é buscada uma única vez com a Alpha-Beta, na profundidade
+especificada, e as buscas são divididas entre vários processos. O livro é consultado por ComputerPlayer
+(parâmetro book_path) e pelo jogo, que usa o livro padrão quando ele existe.
+
+Uso:
+    python book.py --plies 3 --depth 6 --workers 4
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from BuscaCompetitivaTDE import Board, ComputerPlayer, OpeningBook
+
+
+def opening_positions(size, win_length, plies):
+    """Retorna os bitboards (X, O) das posições canônicas com menos de plies marcas e sem vencedor."""
+    layer = {Board(size, win_length).canonical_key()[0]: (0, 0)}  # Hash canônico -> bitboards.
+    positions = []
+    for marks in range(plies):
+        positions.extend(layer.values())
+        player = 'XO'[marks % 2]
+        next_layer = {}
+        for x_mask, o_mask in layer.values() if marks + 1 < plies else ():
+            board = Board.from_masks(size, x_mask, o_mask, win_length)
+            for row, col in board.unique_moves():
+                board.make_move(row, col, player)
+                if not board.check_victory(player) and not board.is_full():
+                    next_layer.setdefault(board.canonical_key()[0], (board.masks['X'], board.masks['O']))
+                board.undo_move(row, col)
+        layer = next_layer
+    return positions
+
+
+def search_position(size, win_length, depth, x_mask, o_mask):
+    """Busca a posição e retorna a entrada do livro: (hash canônico, (jogada canônica, profundidade, valor))."""
+    board = Board.from_masks(size, x_mask, o_mask, win_length)
+    player = ComputerPlayer('XO'[board.marks % 2], 'alpha_beta', depth=depth, board_size=size,
+                            win_length=win_length)
+    row, col = player.choose_move(board)
+    key, transform = board.canonical_key()
+    return key, (board.to_canonical_move(row * size + col, transform), depth, int(round(player.last_value)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=4, help='Tamanho do tabuleiro.')
+    parser.add_argument('--win-length', type=int, help='Marcas em sequência para vencer (padrão: a linha inteira).')
+    parser.add_argument('--plies', type=int, default=3, help='Jogadas cobertas pelo livro.')
+    parser.add_argument('--depth', type=int, default=6, help='Profundidade da busca de cada posição.')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Número de processos.')
+    parser.add_argument('--output', help='Arquivo do livro (padrão: book_<n>x<n>.bin ao lado do jogo).')
+    args = parser.parse_args()
+
+    win_length = args.win_length or args.size
+    path = args.output or OpeningBook.default_path(args.size, win_length)
+    start = time.perf_counter()
+    positions = opening_positions(args.size, win_length, args.plies)
+    print(f"{len(positions)} posições com menos de {args.plies} marcas; buscando com profundidade {args.depth}")
+    count = len(positions)
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        entries = dict(executor.map(search_position, [args.size] * count, [win_length] * count,
+                                    [args.depth] * count, *zip(*positions), chunksize=max(1, count // 64)))
+    OpeningBook.write(path, args.size, win_length, args.plies, entries)
+    print(f"{path}: {len(entries)} entradas ({os.path.getsize(path)} bytes) em {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
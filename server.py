@@ -0,0 +1,304 @@
+"""
+Servidor do motor: responde pedidos de jogada por um socket local, com as buscas aquecidas entre pedidos.
+
+O servidor (asyncio) aceita conexões TCP em localhost ou em um socket Unix e troca mensagens JSON, uma por
+linha. Cada pedido traz a posição, o jogador da vez e o orçamento da busca; a resposta traz a jogada, o
+valor, a profundidade, os nós e a variação principal. As buscas rodam em um pool de processos, e cada
+processo mantém os seus jogadores (com tabelas de transposição preservadas entre pedidos) enquanto o
+servidor estiver no ar.
+
+Uma conexão pode enviar vários pedidos sem esperar as respostas, que chegam na ordem em que terminam,
+com o mesmo "id" do pedido. Quando o cliente desconecta, os pedidos pendentes da conexão são cancelados:
+os que ainda estão na fila não chegam a rodar, e as buscas Minimax e Alpha-Beta em andamento param na
+próxima consulta ao relógio (a MCTS termina a busca, mas a resposta é descartada).
+
+Protocolo:
+    pedido:   {"id": 1, "board": "X...O...........", "strategy": "alpha_beta", "depth": 4}
+    resposta: {"id": 1, "move": [1, 2], "value": 3.0, "depth": 4, "nodes": 1234, "pv": [[1, 2], ...],
+               "seconds": 0.012}
+    erro:     {"id": 1, "error": "..."}
+
+O tabuleiro é o texto das células linha por linha ('X', 'O' ou '.', com '/' opcional entre as linhas), e
+o tamanho é deduzido do número de células. Campos opcionais: "player" (padrão: deduzido pelo número de
+marcas, com X começando), "win_length", "depth", "time_budget" e "playouts".
+
+Uso:
+    python server.py --port 8765 --workers 4
+    python server.py --unix /tmp/velha.sock --book book_4x4.bin
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from BuscaCompetitivaTDE import Board, ComputerPlayer
+
+STRATEGIES = ('random', 'minimax', 'alpha_beta', 'solved', 'mcts')
+CANCEL_SLOTS = 4096  # Posições do vetor de cancelamentos compartilhado (o pedido n usa a posição n % CANCEL_SLOTS).
+MAX_DEPTH = 16  # Maior profundidade fixa aceita em um pedido.
+MAX_TIME_BUDGET = 60.0  # Maior tempo por jogada aceito em um pedido, em segundos.
+
+
+class SearchCancelled(Exception):
+    """Interrompe a busca de um pedido cujo cliente desconectou."""
+
+
+# Estado de cada processo do servidor: o vetor de cancelamentos compartilhado, as opções fixas dos
+# jogadores e os jogadores criados no processo, reaproveitados entre pedidos.
+_cancelled = None
+_player_options = {}
+_players = {}
+
+
+def _init_server_worker(cancelled, player_options):
+    """Inicializa um processo do servidor com o vetor de cancelamentos e as opções dos jogadores."""
+    global _cancelled, _player_options
+    _cancelled = cancelled
+    _player_options = player_options
+
+
+class ServedPlayer(ComputerPlayer):
+    """Jogador dos processos do servidor: a busca também para quando o pedido atual é cancelado."""
+
+    request_id = 0  # Pedido em andamento.
+
+    def count_node(self):
+        """Conta um nó e interrompe a busca se o prazo tiver passado ou o pedido tiver sido cancelado."""
+        super().count_node()
+        if self.nodes % self.TIME_CHECK_INTERVAL == 0 \
+                and _cancelled[self.request_id % CANCEL_SLOTS] == self.request_id:
+            raise SearchCancelled()
+
+
+def is_integer(value):
+    """Retorna se o valor do pedido é um inteiro; true e false não contam (bool é subclasse de int)."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def parse_request(request):
+    """
+    Valida um pedido e retorna os argumentos de serve_position.
+
+    Levanta ValueError se o pedido for inválido ou se a posição não tiver jogada a fazer.
+    """
+    if not isinstance(request, dict):
+        raise ValueError("O pedido deve ser um objeto JSON.")
+    cells = str(request.get('board', '')).replace('/', '').upper().replace('-', '.')
+    size = math.isqrt(len(cells))
+    if size < 2 or size * size != len(cells) or set(cells) - set('XO.'):
+        raise ValueError("Tabuleiro inválido: use size×size células 'X', 'O' ou '.'.")
+    x_mask = sum(1 << index for index, cell in enumerate(cells) if cell == 'X')
+    o_mask = sum(1 << index for index, cell in enumerate(cells) if cell == 'O')
+
+    win_length = request.get('win_length')
+    win_length = size if win_length is None else win_length
+    if not is_integer(win_length) or not 2 <= win_length <= size:
+        raise ValueError(f"win_length deve ser um inteiro entre 2 e {size}.")
+    strategy = request.get('strategy', 'alpha_beta')
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Estratégia desconhecida: {strategy!r}.")
+    player = request.get('player') or ('X' if cells.count('X') == cells.count('O') else 'O')
+    if player not in ('X', 'O'):
+        raise ValueError("player deve ser 'X' ou 'O'.")
+    depth = request.get('depth', 4)
+    if not is_integer(depth) or not 1 <= depth <= MAX_DEPTH:
+        raise ValueError(f"depth deve ser um inteiro entre 1 e {MAX_DEPTH}.")
+    time_budget = request.get('time_budget')
+    if time_budget is not None \
+            and (isinstance(time_budget, bool) or not isinstance(time_budget, (int, float))
+                 or not 0 < time_budget <= MAX_TIME_BUDGET):
+        raise ValueError(f"time_budget deve estar entre 0 e {MAX_TIME_BUDGET} segundos.")
+    playouts = request.get('playouts', 20000)
+    if not is_integer(playouts) or playouts < 1:
+        raise ValueError("playouts deve ser um inteiro positivo.")
+
+    board = Board.from_masks(size, x_mask, o_mask, win_length)
+    if board.check_victory('X') or board.check_victory('O') or board.is_full():
+        raise ValueError("A partida já terminou.")
+    return size, win_length, x_mask, o_mask, player, strategy, depth, time_budget, playouts
+
+
+def serve_position(request_id, size, win_length, x_mask, o_mask, symbol, strategy, depth, time_budget, playouts):
+    """
+    Busca a jogada de um pedido em um processo do pool e retorna o corpo da resposta.
+
+    Os jogadores são criados uma vez por estratégia, jogador e variante do tabuleiro e reaproveitados
+    entre pedidos, com a tabela de transposição preservada. Retorna None se o pedido for cancelado.
+    """
+    if _cancelled[request_id % CANCEL_SLOTS] == request_id:
+        return None
+    key = (strategy, symbol, size, win_length)
+    player = _players.get(key)
+    if player is None:
+        options = dict(_player_options)
+        if strategy not in ('minimax', 'alpha_beta'):
+            options.pop('book_path', None)
+        player = _players[key] = ServedPlayer(symbol, strategy, keep_tt=True, board_size=size,
+                                              win_length=win_length, **options)
+    player.request_id = request_id
+    player.depth = depth
+    player.time_budget = time_budget
+    player.playouts = playouts
+    player.nodes = 0
+    player.last_depth, player.last_value, player.principal_variation = 0, None, []
+
+    board = Board.from_masks(size, x_mask, o_mask, win_length)
+    start = time.perf_counter()
+    try:
+        move = player.choose_move(board)
+    except SearchCancelled:
+        return None
+    seconds = time.perf_counter() - start
+    value = player.last_value
+    return {
+        'move': list(move),
+        'value': float(value) if value is not None and math.isfinite(value) else None,
+        'depth': player.last_depth,
+        'nodes': player.nodes,
+        'pv': [list(cell) for cell in player.principal_variation],
+        'seconds': seconds,
+    }
+
+
+class EngineServer:
+    """Servidor asyncio que distribui os pedidos de jogada entre os processos do pool."""
+
+    def __init__(self, workers=None, tt_size=1 << 18, book_path=None):
+        """
+        Inicializa o servidor (o pool de processos é criado em start).
+
+        Parâmetros:
+            workers (int): Número de processos de busca (padrão: um por CPU).
+            tt_size (int): Entradas da tabela de transposição de cada jogador dos processos.
+            book_path (str): Livro de aberturas consultado pelas buscas Minimax e Alpha-Beta.
+        """
+        self.workers = workers or os.cpu_count()
+        self.player_options = {'tt_size': tt_size}
+        if book_path is not None:
+            self.player_options['book_path'] = book_path
+        self.cancelled = None  # Vetor de cancelamentos compartilhado com os processos.
+        self.executor = None
+        self.server = None
+        self.ids = itertools.count(1)  # Número interno dos pedidos.
+        self.counters = {'connections': 0, 'requests': 0, 'errors': 0, 'cancelled': 0}
+
+    async def start(self, host='127.0.0.1', port=8765, unix_path=None):
+        """Cria o pool de processos e começa a aceitar conexões."""
+        self.cancelled = multiprocessing.Array('q', CANCEL_SLOTS, lock=False)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_server_worker,
+                                            initargs=(self.cancelled, self.player_options))
+        if unix_path is not None:
+            self.server = await asyncio.start_unix_server(self.handle_client, path=unix_path)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server
+
+    async def close(self):
+        """Para de aceitar conexões e encerra o pool de processos."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+
+    async def handle_client(self, reader, writer):
+        """Lê os pedidos de uma conexão e cancela os pendentes quando o cliente desconecta."""
+        self.counters['connections'] += 1
+        pending = set()
+        lock = asyncio.Lock()  # Uma resposta por vez no socket.
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(self.answer(line, writer, lock))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            for task in list(pending):
+                task.cancel()
+            writer.close()
+
+    async def answer(self, line, writer, lock):
+        """Responde um pedido: valida, busca em um processo do pool e escreve a resposta."""
+        self.counters['requests'] += 1
+        request_id = next(self.ids)
+        request = {}
+        try:
+            request = json.loads(line)
+            job = parse_request(request)
+        except ValueError as error:  # json.JSONDecodeError é um ValueError.
+            self.counters['errors'] += 1
+            response = {'error': str(error)}
+        else:
+            try:
+                response = await asyncio.get_running_loop().run_in_executor(self.executor, serve_position,
+                                                                            request_id, *job)
+            except asyncio.CancelledError:
+                # O pedido sai da fila se ainda não começou; se já está rodando, a busca vê a marca e para.
+                self.cancelled[request_id % CANCEL_SLOTS] = request_id
+                self.counters['cancelled'] += 1
+                raise
+            except Exception as error:  # Falha no processo (banco ausente, pool encerrado...).
+                self.counters['errors'] += 1
+                response = {'error': f"Falha na busca: {error}"}
+            if response is None:
+                return
+        response = {'id': request.get('id') if isinstance(request, dict) else None, **response}
+        try:
+            async with lock:
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+
+
+async def serve(args):
+    """Roda o servidor até ser interrompido."""
+    server = EngineServer(args.workers, args.tt_size, args.book)
+    await server.start(args.host, args.port, args.unix)
+    address = args.unix or f"{args.host}:{args.port}"
+    print(f"Servidor do motor em {address} com {server.workers} processos")
+    stop = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)  # Encerramento pelo sistema.
+    except NotImplementedError:  # Windows.
+        pass
+    try:
+        await stop.wait()
+    finally:
+        await server.close()
+        counters = server.counters
+        print(f"{counters['connections']} conexões, {counters['requests']} pedidos, "
+              f"{counters['errors']} erros, {counters['cancelled']} cancelados")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1', help='Endereço TCP.')
+    parser.add_argument('--port', type=int, default=8765, help='Porta TCP.')
+    parser.add_argument('--unix', help='Caminho do socket Unix (substitui o TCP).')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Número de processos de busca.')
+    parser.add_argument('--tt-size', type=int, default=1 << 18,
+                        help='Entradas da tabela de transposição de cada jogador dos processos.')
+    parser.add_argument('--book', help='Livro de aberturas das buscas Minimax e Alpha-Beta.')
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""
+Resolve o Jogo da Velha por completo e grava o valor e a melhor jogada de cada posição em um banco binário.
+
+As posições são resolvidas por camadas, da mais cheia (todas as células marcadas) para o tabuleiro vazio:
+o valor de uma posição com n marcas depende apenas das posições com n + 1 marcas, que já estão no banco.
+Cada camada concluída é registrada no cabeçalho do arquivo, então uma execução interrompida continua da
+última camada completa. Dentro de uma camada, as posições são divididas entre vários processos, que
+escrevem diretamente no arquivo mapeado em memória (cada posição pertence a um único processo).
+
+Uso:
+    python solver.py --size 4 --workers 4
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+import numpy as np
+
+from BuscaCompetitivaTDE import DRAW, LOSS, UNKNOWN, WIN, Board, PositionIndex, SolvedDatabase
+
+# Valor de uma jogada para quem a faz, a partir do valor da posição resultante para o oponente.
+FLIP = {LOSS: WIN, DRAW: DRAW, WIN: LOSS}
+
+
+def create_database(path, size):
+    """Cria o arquivo do banco com todos os índices como desconhecidos, se ele ainda não existir."""
+    index = PositionIndex(size)
+    if os.path.exists(path):
+        with open(path, 'rb') as file:
+            magic, version, stored_size, _ = SolvedDatabase.HEADER.unpack(file.read(SolvedDatabase.HEADER.size))
+        if magic != SolvedDatabase.MAGIC or version != SolvedDatabase.VERSION or stored_size != size:
+            raise ValueError(f"{path} já existe e não é um banco {size}x{size} compatível.")
+        return
+    with open(path, 'wb') as file:
+        file.write(SolvedDatabase.HEADER.pack(SolvedDatabase.MAGIC, SolvedDatabase.VERSION, size, 0))
+        file.truncate(SolvedDatabase.HEADER.size + index.positions)  # Arquivo esparso, preenchido com zeros.
+
+
+def read_layers_done(path):
+    """Retorna a máscara de camadas já concluídas registrada no cabeçalho."""
+    with open(path, 'rb') as file:
+        return SolvedDatabase.HEADER.unpack(file.read(SolvedDatabase.HEADER.size))[3]
+
+
+def write_layers_done(path, layers_done):
+    """Atualiza a máscara de camadas concluídas no cabeçalho."""
+    with open(path, 'r+b') as file:
+        magic, version, size, _ = SolvedDatabase.HEADER.unpack(file.read(SolvedDatabase.HEADER.size))
+        file.seek(0)
+        file.write(SolvedDatabase.HEADER.pack(magic, version, size, layers_done))
+
+
+def solve_position(index, data, x_mask, o_mask, marks):
+    """
+    Calcula o byte do banco de uma posição canônica com o número de marcas especificado.
+
+    Retorna None para posições impossíveis (os dois jogadores com linha completa, ou o jogador da vez
+    já tendo vencido).
+    """
+    x_won = any(x_mask & line == line for line in index.win_lines)
+    o_won = any(o_mask & line == line for line in index.win_lines)
+    x_to_move = marks % 2 == 0  # X sempre começa.
+    if x_won and o_won or (x_won if x_to_move else o_won):
+        return None
+    if x_won or o_won:
+        return LOSS  # O jogador anterior completou uma linha.
+    if marks == index.cells:
+        return DRAW
+
+    occupied = x_mask | o_mask
+    best_value, best_move = UNKNOWN, 0
+    for cell in range(index.cells):
+        bit = 1 << cell
+        if occupied & bit:
+            continue
+        if x_to_move:
+            child = index.canonical(x_mask | bit, o_mask)[0]
+        else:
+            child = index.canonical(x_mask, o_mask | bit)[0]
+        child_value = int(data[child]) & 3
+        if child_value == UNKNOWN:
+            raise RuntimeError(f"A camada {marks + 1} não está completa: posição {child} sem valor.")
+        value = FLIP[child_value]
+        if value > best_value:
+            best_value, best_move = value, cell
+            if value == WIN:
+                break
+    return best_value | best_move << 2
+
+
+def solve_chunk(path, size, marks, x_combinations):
+    """Resolve as posições canônicas da camada cujas marcas de X estão em x_combinations."""
+    index = PositionIndex(size)
+    data = np.memmap(path, dtype=np.uint8, mode='r+', offset=SolvedDatabase.HEADER.size, shape=(index.positions,))
+    o_count = marks // 2
+    solved = 0
+    for xs in x_combinations:
+        x_mask = sum(1 << cell for cell in xs)
+        free = [cell for cell in range(index.cells) if not x_mask >> cell & 1]
+        for os_ in combinations(free, o_count):
+            o_mask = sum(1 << cell for cell in os_)
+            if not index.is_canonical(x_mask, o_mask):
+                continue
+            entry = solve_position(index, data, x_mask, o_mask, marks)
+            if entry is not None:
+                data[index.rank(x_mask, o_mask)] = entry
+                solved += 1
+    data.flush()
+    return solved
+
+
+def solve(path, size, workers):
+    """Resolve todas as camadas ainda não concluídas do banco."""
+    create_database(path, size)
+    cells = size * size
+    layers_done = read_layers_done(path)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for marks in range(cells, -1, -1):
+            if layers_done >> marks & 1:
+                print(f"camada {marks:2d}: já resolvida")
+                continue
+            start = time.perf_counter()
+            x_combinations = list(combinations(range(cells), (marks + 1) // 2))
+            chunk = max(1, len(x_combinations) // (workers * 8))
+            chunks = [x_combinations[i:i + chunk] for i in range(0, len(x_combinations), chunk)]
+            solved = sum(executor.map(solve_chunk, [path] * len(chunks), [size] * len(chunks),
+                                      [marks] * len(chunks), chunks))
+            layers_done |= 1 << marks
+            write_layers_done(path, layers_done)  # Só depois que todos os processos gravaram a camada.
+            print(f"camada {marks:2d}: {solved} posições canônicas em {time.perf_counter() - start:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=4, help='Tamanho do tabuleiro (até 4).')
+    parser.add_argument('--output', help='Arquivo do banco (padrão: solved_<n>x<n>.bin ao lado do jogo).')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Número de processos.')
+    args = parser.parse_args()
+
+    path = args.output or SolvedDatabase.default_path(args.size)
+    start = time.perf_counter()
+    solve(path, args.size, args.workers)
+    database = SolvedDatabase(path)
+    value, _ = database.lookup(Board(args.size))
+    names = {LOSS: 'derrota', DRAW: 'empate', WIN: 'vitória'}
+    print(f"{path}: resolvido em {time.perf_counter() - start:.1f}s; "
+          f"valor do tabuleiro vazio para X: {names[value]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""Testes da validação dos pedidos do servidor do motor."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import pytest  # noqa: E402
+
+from server import parse_request  # noqa: E402
+
+EMPTY = '.' * 16
+
+
+def test_valid_request():
+    size, win_length, x_mask, o_mask, player, strategy, depth, time_budget, playouts = parse_request(
+        {'board': 'X...' + '.O..' + '....' + '....', 'depth': 3, 'time_budget': 0.5, 'playouts': 100})
+    assert (size, win_length, x_mask, o_mask, player) == (4, 4, 1, 1 << 5, 'X')
+    assert (strategy, depth, time_budget, playouts) == ('alpha_beta', 3, 0.5, 100)
+
+
+@pytest.mark.parametrize('field', ['win_length', 'depth', 'time_budget', 'playouts'])
+@pytest.mark.parametrize('value', [True, False])
+def test_booleans_are_rejected(field, value):
+    with pytest.raises(ValueError, match=field):
+        parse_request({'board': EMPTY, field: value})
+
+
+@pytest.mark.parametrize('field, value', [('win_length', 5), ('win_length', 1), ('depth', 0), ('depth', 2.0),
+                                          ('time_budget', 0), ('time_budget', '1'), ('playouts', 0)])
+def test_out_of_range_values_are_rejected(field, value):
+    with pytest.raises(ValueError, match=field):
+        parse_request({'board': EMPTY, field: value})
@@ -0,0 +1,48 @@
+"""Testes da estratégia 'solved' com banco em caminho próprio e busca paralela fora do banco."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import pytest  # noqa: E402
+
+import solver  # noqa: E402
+from BuscaCompetitivaTDE import Board, ComputerPlayer  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def solved_path(tmp_path_factory):
+    """Banco 3x3 gerado fora do caminho padrão."""
+    path = str(tmp_path_factory.mktemp('solved') / 'banco_3x3.bin')
+    solver.solve(path, 3, 1)
+    return path
+
+
+def test_missing_database_raises_with_solver_command(tmp_path):
+    with pytest.raises(FileNotFoundError, match='solver.py'):
+        ComputerPlayer('X', 'solved', board_size=3, solved_path=str(tmp_path / 'ausente.bin'))
+
+
+def test_parallel_fallback_uses_alpha_beta_without_database(solved_path):
+    board = Board(3)
+    board.make_move(1, 1, 'X')  # Vez de O: X fora da vez prevista pelo banco, então a jogada é buscada.
+    player = ComputerPlayer('X', 'solved', board_size=3, solved_path=solved_path, workers=2)
+    serial = ComputerPlayer('X', 'alpha_beta', board_size=3)
+    try:
+        assert player.search_options()['strategy'] == 'alpha_beta'
+        assert player.choose_move(board) == serial.choose_move(board)
+        assert player.last_value == serial.last_value
+    finally:
+        player.close()
+        serial.close()
+
+
+def test_database_move_with_custom_path(solved_path):
+    player = ComputerPlayer('X', 'solved', board_size=3, solved_path=solved_path, workers=2)
+    try:
+        move = player.choose_move(Board(3))
+        assert move in Board(3).empty_cells()
+        assert player.nodes == 0  # Respondida pelo banco, sem busca.
+    finally:
+        player.close()